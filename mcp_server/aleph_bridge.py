@@ -16,11 +16,13 @@ Usage:
 
 import os
 import json
+import asyncio
 import hashlib
+import threading
 import subprocess
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Set
 from dataclasses import dataclass, field
 from functools import lru_cache
 
@@ -137,9 +139,16 @@ class CodebaseIndexer:
             hasher.update(files[path].encode())
         return hasher.hexdigest()[:16]
     
-    def needs_reindex(self) -> bool:
+    def has_changed(self, files: Optional[Dict[str, str]] = None) -> bool:
+        """True if any indexed file's content differs from the last index."""
+        if files is None:
+            files = self._collect_files()
+        return self._compute_hash(files) != self._last_index_hash
+    
+    def needs_reindex(self, files: Optional[Dict[str, str]] = None) -> bool:
         """Check if codebase has changed enough to warrant re-indexing."""
-        files = self._collect_files()
+        if files is None:
+            files = self._collect_files()
         current_hash = self._compute_hash(files)
         
         if current_hash != self._last_index_hash:
@@ -156,12 +165,16 @@ class CodebaseIndexer:
                 
         return False
     
-    def build_context(self) -> str:
+    def build_context(self, files: Optional[Dict[str, str]] = None) -> str:
         """
         Build a single context string from all indexed files.
         Format designed for Aleph's search capabilities.
+        
+        Pass `files` from an earlier _collect_files() to avoid reading
+        the tree again.
         """
-        files = self._collect_files()
+        if files is None:
+            files = self._collect_files()
         
         # Update tracking
         self._last_index_hash = self._compute_hash(files)
@@ -242,10 +255,17 @@ class AlephContextManager:
         # Planning files context (separate, always small)
         self._planning_context_id = "planning"
         
-    def index_codebase(self, force: bool = False) -> Dict[str, Any]:
+    def index_codebase(
+        self,
+        force: bool = False,
+        files: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
         """
         Index the codebase into Aleph.
         Returns stats about the indexing operation.
+        
+        `files` (from CodebaseIndexer._collect_files) is reused instead of
+        walking the tree again.
         """
         if not ALEPH_AVAILABLE:
             return {
@@ -253,7 +273,7 @@ class AlephContextManager:
                 "error": "Aleph not installed. Run: pip install aleph-rlm[mcp]"
             }
         
-        needs_index = force or self.indexer.needs_reindex()
+        needs_index = force or self.indexer.needs_reindex(files)
         
         if not needs_index and self._context_loaded:
             return {
@@ -263,7 +283,7 @@ class AlephContextManager:
             }
         
         # Build and load context
-        context_str = self.indexer.build_context()
+        context_str = self.indexer.build_context(files)
         
         # Use Aleph's load_context
         # This stores the content outside the LLM's context window
@@ -808,11 +828,26 @@ def handle_aleph_tool(name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
 # INTEGRATION HOOKS FOR AUTOCODER
 # =============================================================================
 
+# Seconds to wait for more completions before refreshing the index
+REFRESH_DEBOUNCE_SECONDS = 2.0
+
+# Features completed since the last refresh, and the pending timer
+_pending_refresh: Set[Any] = set()
+_refresh_timer: Optional[asyncio.TimerHandle] = None
+
+# Serializes refreshes running in executor threads
+_refresh_lock = threading.Lock()
+
+
 def on_feature_complete(project_dir: str, feature_id: int) -> Dict[str, Any]:
     """
     Hook called when autocoder marks a feature as complete.
     Refreshes the Aleph index to include new code.
     
+    Inside an event loop (the MCP server) the refresh is debounced:
+    features completed within REFRESH_DEBOUNCE_SECONDS of each other
+    share one refresh. Without a loop it runs immediately.
+    
     Args:
         project_dir: Project directory path
         feature_id: ID of the completed feature
@@ -820,15 +855,69 @@ def on_feature_complete(project_dir: str, feature_id: int) -> Dict[str, Any]:
     Returns:
         Status dict
     """
-    global _manager
+    global _refresh_timer
     
-    # Ensure manager is initialized
-    if _manager is None:
-        init_aleph_bridge(project_dir)
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return on_features_complete_bulk(project_dir, [feature_id])
+    
+    _pending_refresh.add(feature_id)
+    if _refresh_timer is not None:
+        _refresh_timer.cancel()
+    _refresh_timer = loop.call_later(
+        REFRESH_DEBOUNCE_SECONDS, _flush_refresh, project_dir
+    )
+    
+    return {
+        "success": True,
+        "action": "scheduled",
+        "pending_features": len(_pending_refresh)
+    }
+
+
+def _flush_refresh(project_dir: str) -> None:
+    """
+    Run the debounced refresh for all features completed meanwhile, in a
+    worker thread so reading the tree does not block the event loop.
+    """
+    global _refresh_timer
     
-    # Refresh index
-    result = refresh_codebase_index(force=True)
-    result["trigger"] = f"feature_{feature_id}_complete"
+    _refresh_timer = None
+    feature_ids = sorted(_pending_refresh, key=str)
+    _pending_refresh.clear()
+    asyncio.get_running_loop().run_in_executor(
+        None, on_features_complete_bulk, project_dir, feature_ids
+    )
+
+
+def on_features_complete_bulk(project_dir: str, feature_ids: List[Any]) -> Dict[str, Any]:
+    """
+    Refresh the Aleph index once for a batch of completed features.
+    Skipped when no indexed file changed since the last index.
+    
+    Args:
+        project_dir: Project directory path
+        feature_ids: IDs of the completed features
+        
+    Returns:
+        Status dict
+    """
+    with _refresh_lock:
+        # Ensure manager is initialized
+        if _manager is None:
+            init_aleph_bridge(project_dir)
+        
+        # Refresh index only if the code actually changed; the tree is
+        # read once and shared by the change check and the re-index
+        if ALEPH_AVAILABLE:
+            files = _manager.indexer._collect_files()
+            result = _manager.index_codebase(
+                force=_manager.indexer.has_changed(files), files=files
+            )
+        else:
+            result = refresh_codebase_index()
+    result["trigger"] = ", ".join(f"feature_{fid}_complete" for fid in feature_ids)
     
     return result
 
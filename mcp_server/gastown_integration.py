@@ -29,6 +29,27 @@ from dataclasses import dataclass, field, asdict
 from enum import Enum
 import uuid
 
+# libyaml-backed (C) YAML when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as _YamlDumper, CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper, SafeLoader as _YamlLoader
+
+
+class _BeadDumper(_YamlDumper):
+    """Writes multi-line strings (descriptions, notes) as literal blocks."""
+
+
+def _represent_str(dumper, data):
+    style = "|" if "\n" in data else None
+    return dumper.represent_scalar("tag:yaml.org,2002:str", data, style=style)
+
+
+_BeadDumper.add_representer(str, _represent_str)
+
+# No line wrapping: long values are written as-is instead of being folded
+_YAML_WIDTH = 1 << 30
+
 
 # =============================================================================
 # BEAD STATUS
@@ -146,13 +167,14 @@ class Bead:
         # Remove None values for cleaner YAML
         data = {k: v for k, v in data.items() if v is not None}
         return yaml.dump(
-            data, default_flow_style=False, sort_keys=False, allow_unicode=True
+            data, Dumper=_BeadDumper, width=_YAML_WIDTH,
+            default_flow_style=False, sort_keys=False, allow_unicode=True
         )
 
     @classmethod
     def from_yaml(cls, yaml_content: str) -> "Bead":
         """Deserialize Bead from YAML."""
-        data = yaml.safe_load(yaml_content)
+        data = yaml.load(yaml_content, Loader=_YamlLoader)
         return cls(
             id=data.get("id", ""),
             name=data.get("name", ""),
@@ -202,6 +224,20 @@ class Bead:
 # =============================================================================
 
 
+def _write_file(path: Path, text: str) -> None:
+    """
+    Write text as UTF-8 with a bare open/write/close. No fsync: the git
+    commit that follows is where durability matters.
+    """
+    data = memoryview(text.encode("utf-8"))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+
 class BeadStore:
     """
     Git-backed storage for Beads.
@@ -264,7 +300,7 @@ class BeadStore:
 
         # Write YAML file
         bead_path = self._bead_path(bead.id)
-        bead_path.write_text(bead.to_yaml())
+        _write_file(bead_path, bead.to_yaml())
 
         if self.auto_commit:
             # Stage and commit
@@ -293,7 +329,7 @@ class BeadStore:
         if not bead_path.exists():
             return None
 
-        yaml_content = bead_path.read_text()
+        yaml_content = bead_path.read_text(encoding="utf-8")
         return Bead.from_yaml(yaml_content)
 
     def load_all(self) -> List[Bead]:
@@ -304,7 +340,7 @@ class BeadStore:
             if bead_file.name == ".gitkeep":
                 continue
             try:
-                yaml_content = bead_file.read_text()
+                yaml_content = bead_file.read_text(encoding="utf-8")
                 bead = Bead.from_yaml(yaml_content)
                 beads.append(bead)
             except Exception as e:
@@ -521,12 +557,15 @@ class Convoy:
         """Serialize Convoy to YAML."""
         data = asdict(self)
         data = {k: v for k, v in data.items() if v is not None}
-        return yaml.dump(data, default_flow_style=False, sort_keys=False)
+        return yaml.dump(
+            data, Dumper=_BeadDumper, width=_YAML_WIDTH,
+            default_flow_style=False, sort_keys=False
+        )
 
     @classmethod
     def from_yaml(cls, yaml_content: str) -> "Convoy":
         """Deserialize Convoy from YAML."""
-        data = yaml.safe_load(yaml_content)
+        data = yaml.load(yaml_content, Loader=_YamlLoader)
         return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
 
 
@@ -562,7 +601,7 @@ class ConvoyStore:
         convoy.updated_at = datetime.now().isoformat()
 
         convoy_path = self._convoy_path(convoy.id)
-        convoy_path.write_text(convoy.to_yaml())
+        _write_file(convoy_path, convoy.to_yaml())
 
         if self.auto_commit:
             rel_path = convoy_path.relative_to(self.project_dir)
@@ -580,7 +619,7 @@ class ConvoyStore:
         if not convoy_path.exists():
             return None
 
-        yaml_content = convoy_path.read_text()
+        yaml_content = convoy_path.read_text(encoding="utf-8")
         return Convoy.from_yaml(yaml_content)
 
     def load_all(self) -> List[Convoy]:
@@ -589,7 +628,7 @@ class ConvoyStore:
 
         for convoy_file in self.convoys_dir.glob("*.yaml"):
             try:
-                yaml_content = convoy_file.read_text()
+                yaml_content = convoy_file.read_text(encoding="utf-8")
                 convoy = Convoy.from_yaml(yaml_content)
                 convoys.append(convoy)
             except Exception as e:
@@ -24,24 +24,32 @@ Usage:
 
 import os
 import json
+import hashlib
+import asyncio
+import selectors
+import shlex
+import shutil
 import subprocess
 import re
+import time
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Set, Tuple, Union
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import IntEnum
 
 
 # =============================================================================
 # CONFIGURATION
 # =============================================================================
 
-class CheckStatus(Enum):
-    PASSED = "passed"
-    FAILED = "failed"
-    SKIPPED = "skipped"
-    WARNING = "warning"
+class CheckStatus(IntEnum):
+    PASSED = 0
+    FAILED = 1
+    WARNING = 2
+    SKIPPED = 3
 
 
 @dataclass
@@ -56,7 +64,7 @@ class CheckResult:
     def to_dict(self) -> Dict[str, Any]:
         return {
             "name": self.name,
-            "status": self.status.value,
+            "status": self.status.name.lower(),
             "message": self.message,
             "details": self.details,
             "duration_ms": self.duration_ms
@@ -91,9 +99,22 @@ class QualityGateConfig:
     require_build: bool = True
     build_command: str = "npm run build"
     
+    # Detected project type: "node" | "python" | "go" | "unknown"
+    project_type: str = "unknown"
+    
     # Custom checks
     custom_checks: List[Dict[str, str]] = field(default_factory=list)
     
+    # Verification agent
+    force_agent_on_fail: bool = False
+    
+    # Reuse the last test result when no source file changed since it ran
+    reuse_unchanged_tests: bool = True
+    
+    # Opt-in: run read-only checks concurrently (at most one per CPU);
+    # tests and build always run one after the other
+    parallel_checks: bool = False
+    
     @classmethod
     def from_file(cls, path: Path) -> "QualityGateConfig":
         """Load config from JSON file."""
@@ -113,6 +134,75 @@ class QualityGateConfig:
 # QUALITY GATE RUNNER
 # =============================================================================
 
+# Directories that never hold sources (dependencies, caches), at any depth
+_FINGERPRINT_SKIP_DIRS = frozenset({
+    ".git", "node_modules", "__pycache__", ".venv", "venv", ".tox", ".nox",
+    ".pytest_cache", ".mypy_cache", ".ruff_cache"
+})
+
+# Output directories, skipped only at the project root: nested ones
+# (e.g. src/build/) may be real source packages
+_FINGERPRINT_SKIP_TOP_DIRS = frozenset({
+    "coverage", "htmlcov", "dist", "build", ".next"
+})
+
+# Files written by test runners and by the server itself, which must not
+# invalidate the test result cache
+_FINGERPRINT_SKIP_FILE_PREFIXES = (".coverage", "coverage.xml", "junit", "features.db")
+
+# Checks that write to the tree (installs, build output, coverage) and
+# must not overlap each other or tests reading it
+_SERIAL_CHECKS = ("tests", "build")
+
+# Characters that require /bin/sh to interpret the command
+_SHELL_METACHARS = frozenset("|&;<>*?$`(){}[]\\\"'~\n")
+
+# Commands the shell runs itself; there is no executable to exec
+_SHELL_BUILTINS = frozenset({
+    "cd", "export", "source", ".", "set", "unset", "alias", "eval",
+    "exec", "ulimit", "umask", "test", "[", "true", "false", ":"
+})
+
+# Leading `NAME=value` environment assignment
+_ENV_ASSIGNMENT_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*=")
+
+
+def _needs_shell(command: str) -> bool:
+    """
+    True if the command uses shell syntax (pipes, globs, ||, quoting...),
+    starts with an environment assignment or runs a shell builtin.
+    """
+    if any(c in _SHELL_METACHARS for c in command):
+        return True
+    first = command.split(None, 1)[0] if command.strip() else ""
+    return first in _SHELL_BUILTINS or bool(_ENV_ASSIGNMENT_RE.match(first))
+
+
+def _command_args(command: str) -> Tuple[Union[str, List[str]], bool]:
+    """
+    Return (args, shell) for subprocess. Plain commands are exec'd
+    directly to avoid forking /bin/sh for every check.
+    """
+    if _needs_shell(command):
+        return command, True
+    return shlex.split(command), False
+
+
+def _exec_not_found(
+    error: FileNotFoundError,
+    args: Union[str, List[str]],
+    shell: bool
+) -> Tuple[int, str, str]:
+    """
+    Result for a FileNotFoundError from Popen: the shell's "command not
+    found" status when the exec'd program is missing, otherwise (e.g. a
+    missing cwd) the generic -1 error.
+    """
+    if not shell and error.filename == args[0]:
+        return 127, "", f"{error.filename}: command not found"
+    return -1, "", str(error)
+
+
 class QualityGateRunner:
     """
     Runs quality gate checks on the codebase.
@@ -133,7 +223,12 @@ class QualityGateRunner:
     ):
         self.project_dir = Path(project_dir)
         self.config = config or self._detect_config()
+        self._auto_config = config is None
         self._results: List[CheckResult] = []
+        self._test_cache: Optional[Tuple[str, CheckResult]] = None
+    
+    # Executables already found on PATH (shared across runners)
+    _tool_cache: Set[str] = set()
         
     def _detect_config(self) -> QualityGateConfig:
         """Auto-detect project configuration."""
@@ -142,6 +237,7 @@ class QualityGateRunner:
         # Check for package.json
         pkg_json = self.project_dir / "package.json"
         if pkg_json.exists():
+            config.project_type = "node"
             with open(pkg_json) as f:
                 pkg = json.load(f)
                 scripts = pkg.get("scripts", {})
@@ -172,7 +268,9 @@ class QualityGateRunner:
                     
         # Check for Python project
         elif (self.project_dir / "pyproject.toml").exists() or \
-             (self.project_dir / "setup.py").exists():
+             (self.project_dir / "setup.py").exists() or \
+             (self.project_dir / "pytest.ini").exists():
+            config.project_type = "python"
             config.lint_command = "ruff check . || pylint **/*.py"
             config.type_check_command = "mypy ."
             config.format_command = "black --check ."
@@ -181,6 +279,7 @@ class QualityGateRunner:
             
         # Check for Go project
         elif (self.project_dir / "go.mod").exists():
+            config.project_type = "go"
             config.lint_command = "golangci-lint run"
             config.type_check_command = "go vet ./..."
             config.format_command = "gofmt -l ."
@@ -189,16 +288,123 @@ class QualityGateRunner:
             
         return config
     
+    def _redetect_unknown_project(self) -> None:
+        """
+        Retry auto-detection while the project type is still unknown: the
+        runner may be created before package.json / pyproject.toml exist.
+        """
+        if not self._auto_config or self.config.project_type != "unknown":
+            return
+        detected = self._detect_config()
+        if detected.project_type != "unknown":
+            self.config = detected
+    
     def _run_command(
         self, 
         command: str, 
         timeout: int = 300
     ) -> Tuple[int, str, str]:
         """Run a shell command and return (exit_code, stdout, stderr)."""
+        if not hasattr(os, "pidfd_open"):
+            return self._run_command_polling(command, timeout)
+        
+        args, shell = _command_args(command)
+        try:
+            proc = subprocess.Popen(
+                args,
+                shell=shell,
+                cwd=str(self.project_dir),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE
+            )
+        except FileNotFoundError as e:
+            return _exec_not_found(e, args, shell)
+        except Exception as e:
+            return -1, "", str(e)
+        
+        try:
+            stdout, stderr = self._wait_with_pidfd(proc, timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            return -1, "", f"Command timed out after {timeout}s"
+        except Exception as e:
+            proc.kill()
+            proc.wait()
+            return -1, "", str(e)
+        finally:
+            proc.stdout.close()
+            proc.stderr.close()
+        
+        return (
+            proc.returncode,
+            stdout.decode("utf-8", errors="replace"),
+            stderr.decode("utf-8", errors="replace")
+        )
+    
+    @staticmethod
+    def _wait_with_pidfd(
+        proc: subprocess.Popen,
+        timeout: int
+    ) -> Tuple[bytes, bytes]:
+        """
+        Wait for proc to exit without polling.
+        
+        Blocks in select() on a pidfd plus the output pipes, so the child
+        is reaped as soon as it exits and the pipes are drained as data
+        arrives (a full pipe would otherwise stall the child).
+        """
+        try:
+            pidfd = os.pidfd_open(proc.pid)
+        except OSError:
+            # Kernel without pidfd support (< 5.3)
+            return proc.communicate(timeout=timeout)
+        
+        chunks: Dict[int, List[bytes]] = {
+            proc.stdout.fileno(): [],
+            proc.stderr.fileno(): []
+        }
+        deadline = time.monotonic() + timeout
+        
+        try:
+            with selectors.DefaultSelector() as sel:
+                sel.register(pidfd, selectors.EVENT_READ)
+                for fd in chunks:
+                    sel.register(fd, selectors.EVENT_READ)
+                
+                while sel.get_map():
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise subprocess.TimeoutExpired(proc.args, timeout)
+                    for key, _ in sel.select(remaining):
+                        if key.fd == pidfd:
+                            sel.unregister(pidfd)
+                            continue
+                        data = os.read(key.fd, 65536)
+                        if data:
+                            chunks[key.fd].append(data)
+                        else:
+                            sel.unregister(key.fd)
+        finally:
+            os.close(pidfd)
+        
+        proc.wait()
+        return (
+            b"".join(chunks[proc.stdout.fileno()]),
+            b"".join(chunks[proc.stderr.fileno()])
+        )
+    
+    def _run_command_polling(
+        self, 
+        command: str, 
+        timeout: int = 300
+    ) -> Tuple[int, str, str]:
+        """Fallback for platforms without os.pidfd_open."""
+        args, shell = _command_args(command)
         try:
             result = subprocess.run(
-                command,
-                shell=True,
+                args,
+                shell=shell,
                 cwd=str(self.project_dir),
                 capture_output=True,
                 text=True,
@@ -207,28 +413,144 @@ class QualityGateRunner:
             return result.returncode, result.stdout, result.stderr
         except subprocess.TimeoutExpired:
             return -1, "", f"Command timed out after {timeout}s"
+        except FileNotFoundError as e:
+            return _exec_not_found(e, args, shell)
         except Exception as e:
             return -1, "", str(e)
     
+    def _tool_available(self, tool: str) -> bool:
+        """
+        Check whether an executable is on PATH. Only hits are cached, so a
+        tool installed mid-session is picked up on the next check. Paths
+        (bin/lint, ./gradlew) are resolved against the project directory
+        and never cached.
+        """
+        if "/" in tool:
+            return os.access(self.project_dir / tool, os.X_OK)
+        if tool in self._tool_cache:
+            return True
+        if shutil.which(tool) is None:
+            return False
+        self._tool_cache.add(tool)
+        return True
+    
+    def _missing_tool(self, command: str) -> Optional[str]:
+        """
+        Return the executable `command` would run if it is not installed,
+        or None if the command can run. For `a || b` fallbacks one
+        available alternative is enough. Launchers (npm, npx, python -m)
+        resolve their own targets, so the launcher itself is checked.
+        Leading NAME=value assignments are skipped; builtins and compound
+        commands (&&, ;, pipes) cannot be judged and return None.
+        """
+        missing = None
+        for alternative in command.split("||"):
+            if any(c in alternative for c in "&;|()`$"):
+                return None
+            try:
+                tokens = shlex.split(alternative)
+            except ValueError:
+                return None
+            while tokens and _ENV_ASSIGNMENT_RE.match(tokens[0]):
+                tokens.pop(0)
+            if not tokens:
+                continue
+            if tokens[0] in _SHELL_BUILTINS or self._tool_available(tokens[0]):
+                return None
+            missing = missing or tokens[0]
+        return missing
+    
+    def _skip_if_missing(self, name: str, command: str) -> Optional[CheckResult]:
+        """SKIPPED result when the check's tool is not installed."""
+        tool = self._missing_tool(command)
+        if tool is None:
+            return None
+        return CheckResult(
+            name=name,
+            status=CheckStatus.SKIPPED,
+            message=f"{tool} not installed"
+        )
+    
+    def _source_fingerprint(self) -> str:
+        """
+        Fingerprint of the project tree: a hash of (path, size, mtime) for
+        every file, so edits, additions, deletions and renames all change it.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        root = str(self.project_dir)
+        stack = [root]
+        while stack:
+            path = stack.pop()
+            top = path == root
+            try:
+                with os.scandir(path) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name in _FINGERPRINT_SKIP_DIRS:
+                                continue
+                            if top and entry.name in _FINGERPRINT_SKIP_TOP_DIRS:
+                                continue
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            if entry.name.startswith(_FINGERPRINT_SKIP_FILE_PREFIXES):
+                                continue
+                            st = entry.stat(follow_symlinks=False)
+                            digest.update(
+                                f"{os.path.relpath(entry.path, root)}\0"
+                                f"{st.st_size}\0{st.st_mtime_ns}\n".encode(
+                                    "utf-8", "surrogateescape"
+                                )
+                            )
+            except OSError:
+                continue
+        return digest.hexdigest()
+    
     def check_tests(self) -> CheckResult:
-        """Run test suite and check coverage."""
-        import time
-        start = time.time()
+        """
+        Run test suite and check coverage.
         
-        # Detect test command
-        pkg_json = self.project_dir / "package.json"
-        if pkg_json.exists():
+        Test runs dominate gate time, so when nothing in the tree changed
+        since the last run the previous result is returned instead of
+        cold-starting the test runner again.
+        """
+        self._redetect_unknown_project()
+        if not self.config.reuse_unchanged_tests:
+            return self._run_tests()
+        
+        # Fingerprint before the run so edits made while tests are running
+        # are not mistaken for tested code
+        fingerprint = self._source_fingerprint()
+        if self._test_cache and self._test_cache[0] == fingerprint:
+            return self._test_cache[1]
+        
+        result = self._run_tests()
+        # Only passing runs are reused: a failure may come from a missing
+        # dependency or a flaky test and must be re-run after an install
+        if result.status in (CheckStatus.PASSED, CheckStatus.WARNING):
+            self._test_cache = (fingerprint, result)
+        return result
+    
+    def _run_tests(self) -> CheckResult:
+        """Run the detected test command and interpret its output."""
+        start = time.perf_counter()
+        
+        # Test command follows the project type found by _detect_config
+        project_type = self.config.project_type
+        if project_type == "node":
             test_cmd = "npm test -- --coverage --passWithNoTests"
-        elif (self.project_dir / "pytest.ini").exists() or \
-             (self.project_dir / "pyproject.toml").exists():
+        elif project_type == "python":
             test_cmd = "pytest --cov=. --cov-report=term-missing"
-        elif (self.project_dir / "go.mod").exists():
+        elif project_type == "go":
             test_cmd = "go test -cover ./..."
         else:
             test_cmd = "npm test || pytest || go test ./..."
         
+        skipped = self._skip_if_missing("tests", test_cmd)
+        if skipped:
+            return skipped
+        
         exit_code, stdout, stderr = self._run_command(test_cmd)
-        duration = int((time.time() - start) * 1000)
+        duration = int((time.perf_counter() - start) * 1000)
         
         if exit_code == 0:
             # Try to extract coverage
@@ -274,11 +596,14 @@ class QualityGateRunner:
     
     def check_lint(self) -> CheckResult:
         """Run linter."""
-        import time
-        start = time.time()
+        start = time.perf_counter()
+        
+        skipped = self._skip_if_missing("lint", self.config.lint_command)
+        if skipped:
+            return skipped
         
         exit_code, stdout, stderr = self._run_command(self.config.lint_command)
-        duration = int((time.time() - start) * 1000)
+        duration = int((time.perf_counter() - start) * 1000)
         
         if exit_code == 0:
             return CheckResult(
@@ -300,8 +625,7 @@ class QualityGateRunner:
     
     def check_types(self) -> CheckResult:
         """Run type checker."""
-        import time
-        start = time.time()
+        start = time.perf_counter()
         
         if not self.config.require_type_check:
             return CheckResult(
@@ -310,8 +634,12 @@ class QualityGateRunner:
                 message="Type checking not configured"
             )
         
+        skipped = self._skip_if_missing("types", self.config.type_check_command)
+        if skipped:
+            return skipped
+        
         exit_code, stdout, stderr = self._run_command(self.config.type_check_command)
-        duration = int((time.time() - start) * 1000)
+        duration = int((time.perf_counter() - start) * 1000)
         
         if exit_code == 0:
             return CheckResult(
@@ -332,11 +660,14 @@ class QualityGateRunner:
     
     def check_format(self) -> CheckResult:
         """Check code formatting."""
-        import time
-        start = time.time()
+        start = time.perf_counter()
+        
+        skipped = self._skip_if_missing("format", self.config.format_command)
+        if skipped:
+            return skipped
         
         exit_code, stdout, stderr = self._run_command(self.config.format_command)
-        duration = int((time.time() - start) * 1000)
+        duration = int((time.perf_counter() - start) * 1000)
         
         if exit_code == 0:
             return CheckResult(
@@ -356,11 +687,14 @@ class QualityGateRunner:
     
     def check_security(self) -> CheckResult:
         """Run security scan."""
-        import time
-        start = time.time()
+        start = time.perf_counter()
+        
+        skipped = self._skip_if_missing("security", self.config.security_command)
+        if skipped:
+            return skipped
         
         exit_code, stdout, stderr = self._run_command(self.config.security_command)
-        duration = int((time.time() - start) * 1000)
+        duration = int((time.perf_counter() - start) * 1000)
         
         if exit_code == 0:
             return CheckResult(
@@ -395,11 +729,14 @@ class QualityGateRunner:
     
     def check_build(self) -> CheckResult:
         """Verify build succeeds."""
-        import time
-        start = time.time()
+        start = time.perf_counter()
+        
+        skipped = self._skip_if_missing("build", self.config.build_command)
+        if skipped:
+            return skipped
         
         exit_code, stdout, stderr = self._run_command(self.config.build_command)
-        duration = int((time.time() - start) * 1000)
+        duration = int((time.perf_counter() - start) * 1000)
         
         if exit_code == 0:
             return CheckResult(
@@ -431,6 +768,55 @@ class QualityGateRunner:
         Returns:
             Dict with overall status and individual check results
         """
+        selected = self._select_checks(checks)
+        
+        if not self.config.parallel_checks or len(selected) < 2:
+            results = [check() for _, check in selected]
+        else:
+            # Read-only checks mostly wait on their own subprocess, so
+            # running them on threads overlaps the external tools
+            concurrent = [check for name, check in selected if name not in _SERIAL_CHECKS]
+            workers = max(1, min(len(concurrent), os.cpu_count() or 1))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                done = dict(zip(concurrent, pool.map(lambda check: check(), concurrent)))
+            for name, check in selected:
+                if name in _SERIAL_CHECKS:
+                    done[check] = check()
+            results = [done[check] for _, check in selected]
+        
+        self._results.extend(results)
+        return self._summarize(results)
+    
+    async def run_all_checks_async(
+        self,
+        checks: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        run_all_checks for callers on an event loop: read-only checks run
+        concurrently in worker threads, at most one per CPU, then tests
+        and build run one after the other.
+        """
+        semaphore = asyncio.Semaphore(os.cpu_count() or 1)
+        
+        async def run(check) -> CheckResult:
+            async with semaphore:
+                return await asyncio.to_thread(check)
+        
+        selected = self._select_checks(checks)
+        concurrent = [check for name, check in selected if name not in _SERIAL_CHECKS]
+        done = dict(zip(concurrent, await asyncio.gather(
+            *(run(check) for check in concurrent)
+        )))
+        for name, check in selected:
+            if name in _SERIAL_CHECKS:
+                done[check] = await asyncio.to_thread(check)
+        results = [done[check] for _, check in selected]
+        self._results.extend(results)
+        return self._summarize(results)
+    
+    def _select_checks(self, checks: Optional[List[str]]) -> List[Tuple[str, Any]]:
+        """(name, check method) for the given names (all checks by default), in order."""
+        self._redetect_unknown_project()
         all_checks = {
             "tests": self.check_tests,
             "lint": self.check_lint,
@@ -441,24 +827,22 @@ class QualityGateRunner:
         }
         
         checks_to_run = checks or list(all_checks.keys())
-        results = []
-        
-        for check_name in checks_to_run:
-            if check_name in all_checks:
-                result = all_checks[check_name]()
-                results.append(result)
-                self._results.append(result)
-        
-        # Determine overall status
-        failed = [r for r in results if r.status == CheckStatus.FAILED]
-        warnings = [r for r in results if r.status == CheckStatus.WARNING]
+        return [(name, all_checks[name]) for name in checks_to_run if name in all_checks]
+    
+    @staticmethod
+    def _summarize(results: List[CheckResult]) -> Dict[str, Any]:
+        """Overall status and per-check results."""
+        # Determine overall status (single pass over results)
+        counts = Counter(r.status for r in results)
+        failed = counts[CheckStatus.FAILED]
+        warnings = counts[CheckStatus.WARNING]
         
         if failed:
             overall_status = "failed"
-            overall_message = f"{len(failed)} check(s) failed"
+            overall_message = f"{failed} check(s) failed"
         elif warnings:
             overall_status = "warning"
-            overall_message = f"Passed with {len(warnings)} warning(s)"
+            overall_message = f"Passed with {warnings} warning(s)"
         else:
             overall_status = "passed"
             overall_message = "All checks passed"
@@ -470,10 +854,10 @@ class QualityGateRunner:
             "checks": [r.to_dict() for r in results],
             "summary": {
                 "total": len(results),
-                "passed": len([r for r in results if r.status == CheckStatus.PASSED]),
-                "failed": len(failed),
-                "warnings": len(warnings),
-                "skipped": len([r for r in results if r.status == CheckStatus.SKIPPED])
+                "passed": counts[CheckStatus.PASSED],
+                "failed": failed,
+                "warnings": warnings,
+                "skipped": counts[CheckStatus.SKIPPED]
             }
         }
     
@@ -490,6 +874,63 @@ class QualityGateRunner:
 # VERIFICATION AGENT
 # =============================================================================
 
+# Maximum amount of code changes included in the verification prompt
+MAX_CODE_CHANGES_CHARS = 10000
+
+
+# Static parts of the verification prompt
+_VERIFICATION_HEADER = "\n".join([
+    "=" * 60,
+    "VERIFICATION TASK",
+    "=" * 60,
+    "",
+    "You are a code reviewer. Your job is to verify that the",
+    "implementation below correctly implements the feature spec.",
+    "",
+    "## FEATURE SPECIFICATION"
+])
+
+_VERIFICATION_INSTRUCTIONS = "\n".join([
+    "## YOUR VERIFICATION CHECKLIST",
+    "",
+    "1. **Correctness**: Does the code implement all requirements?",
+    "2. **Edge Cases**: Are edge cases handled?",
+    "3. **Error Handling**: Is error handling complete?",
+    "4. **Security**: Any security issues? (injection, auth, etc.)",
+    "5. **Performance**: Any obvious performance issues?",
+    "6. **Tests**: Are there sufficient tests?",
+    "",
+    "## OUTPUT FORMAT",
+    "",
+    "Respond with ONE of:",
+    "- VERIFIED: <brief reason>",
+    "- ISSUES_FOUND: <list of issues>",
+    "- NEEDS_TESTS: <what tests are missing>",
+    "- SECURITY_CONCERN: <specific concern>",
+    ""
+])
+
+
+def _bounded_code_changes(
+    code_changes: Union[str, bytes, Path],
+    limit: int = MAX_CODE_CHANGES_CHARS
+) -> str:
+    """
+    Return at most `limit` characters of code changes.
+    
+    A Path is read with a bounded read so large diffs never need to be
+    loaded in full; bytes are truncated before decoding.
+    """
+    if isinstance(code_changes, Path):
+        with open(code_changes, encoding="utf-8", errors="replace") as f:
+            return f.read(limit)
+    if isinstance(code_changes, (bytes, bytearray, memoryview)):
+        return bytes(memoryview(code_changes)[:limit]).decode(
+            "utf-8", errors="replace"
+        )
+    return code_changes[:limit]
+
+
 class VerificationAgent:
     """
     Spawns a second Claude to verify code produced by the first.
@@ -501,24 +942,18 @@ class VerificationAgent:
     def __init__(self, project_dir: Path):
         self.project_dir = Path(project_dir)
         self.quality_runner = QualityGateRunner(project_dir)
+        self.config = self.quality_runner.config
         
     def build_verification_prompt(
         self,
         feature: Dict[str, Any],
-        code_changes: str,
+        code_changes: Union[str, bytes, Path],
         test_results: Optional[Dict] = None
     ) -> str:
         """Build prompt for verification agent."""
         
         prompt_parts = [
-            "=" * 60,
-            "VERIFICATION TASK",
-            "=" * 60,
-            "",
-            "You are a code reviewer. Your job is to verify that the",
-            "implementation below correctly implements the feature spec.",
-            "",
-            "## FEATURE SPECIFICATION",
+            _VERIFICATION_HEADER,
             f"**Name:** {feature.get('name', 'Unknown')}",
             f"**Description:** {feature.get('description', 'No description')}",
             "",
@@ -535,7 +970,7 @@ class VerificationAgent:
             "",
             "## CODE CHANGES",
             "```",
-            code_changes[:10000],  # Limit size
+            _bounded_code_changes(code_changes),
             "```",
             ""
         ])
@@ -548,39 +983,22 @@ class VerificationAgent:
                 ""
             ])
         
-        prompt_parts.extend([
-            "## YOUR VERIFICATION CHECKLIST",
-            "",
-            "1. **Correctness**: Does the code implement all requirements?",
-            "2. **Edge Cases**: Are edge cases handled?",
-            "3. **Error Handling**: Is error handling complete?",
-            "4. **Security**: Any security issues? (injection, auth, etc.)",
-            "5. **Performance**: Any obvious performance issues?",
-            "6. **Tests**: Are there sufficient tests?",
-            "",
-            "## OUTPUT FORMAT",
-            "",
-            "Respond with ONE of:",
-            "- VERIFIED: <brief reason>",
-            "- ISSUES_FOUND: <list of issues>",
-            "- NEEDS_TESTS: <what tests are missing>",
-            "- SECURITY_CONCERN: <specific concern>",
-            ""
-        ])
+        prompt_parts.append(_VERIFICATION_INSTRUCTIONS)
         
         return "\n".join(prompt_parts)
     
     def verify_feature(
         self,
         feature: Dict[str, Any],
-        code_changes: str = None
+        code_changes: Optional[Union[str, bytes, Path]] = None
     ) -> Dict[str, Any]:
         """
         Verify a feature implementation.
         
         Steps:
         1. Run automated quality checks
-        2. If code_changes provided, spawn verification agent
+        2. If code_changes provided and automated checks did not fail,
+           spawn verification agent
         3. Return combined results
         """
         results = {
@@ -600,8 +1018,18 @@ class VerificationAgent:
                 "message": str(e)
             }
         
-        # Step 2: Spawn verification agent if code provided
-        if code_changes:
+        # Step 2: Spawn verification agent if code provided. A failed
+        # automated gate already forces overall_status to "failed", so the
+        # agent call would be wasted unless explicitly requested.
+        if (
+            results["automated_checks"].get("status") == "failed"
+            and not self.config.force_agent_on_fail
+        ):
+            results["agent_verification"] = {
+                "status": "skipped",
+                "message": "Automated checks failed; skipping agent"
+            }
+        elif code_changes:
             verification_prompt = self.build_verification_prompt(
                 feature, 
                 code_changes,
@@ -693,6 +1121,16 @@ def init_quality_gates(project_dir: str) -> Dict[str, Any]:
     global _quality_runner, _verifier
     
     path = Path(project_dir)
+    
+    # Re-initializing for the same project keeps the detected config
+    if _quality_runner is not None and _quality_runner.project_dir == path:
+        return {
+            "success": True,
+            "cached": True,
+            "project_dir": project_dir,
+            "config": _quality_runner.config.__dict__
+        }
+    
     _quality_runner = QualityGateRunner(path)
     _verifier = VerificationAgent(path)
     
@@ -727,14 +1165,15 @@ def run_quality_checks(
 
 def verify_feature_implementation(
     feature: Dict[str, Any],
-    code_changes: Optional[str] = None
+    code_changes: Optional[Union[str, bytes, Path]] = None
 ) -> Dict[str, Any]:
     """
     Verify a feature implementation with automated + agent checks.
     
     Args:
         feature: Feature dict with name, description, test_cases
-        code_changes: Optional string of code changes to verify
+        code_changes: Optional code changes to verify (str, bytes, or a
+                      Path to a diff file, read only up to the prompt limit)
     """
     if _verifier is None:
         return {"error": "Quality gates not initialized"}
@@ -799,21 +1238,22 @@ def get_quality_tools() -> List[Dict[str, Any]]:
     ]
 
 
+_QUALITY_TOOL_HANDLERS = {
+    "quality_init": lambda args: init_quality_gates(args["project_dir"]),
+    "quality_check": lambda args: run_quality_checks(
+        args.get("checks"),
+        args.get("quick", False)
+    ),
+    "quality_verify": lambda args: verify_feature_implementation(
+        args["feature"],
+        args.get("code_changes")
+    )
+}
+
+
 def handle_quality_tool(name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
     """Handle a quality gate tool call."""
-    handlers = {
-        "quality_init": lambda args: init_quality_gates(args["project_dir"]),
-        "quality_check": lambda args: run_quality_checks(
-            args.get("checks"),
-            args.get("quick", False)
-        ),
-        "quality_verify": lambda args: verify_feature_implementation(
-            args["feature"],
-            args.get("code_changes")
-        )
-    }
-    
-    handler = handlers.get(name)
+    handler = _QUALITY_TOOL_HANDLERS.get(name)
     if handler is None:
         return {"error": f"Unknown quality tool: {name}"}
     
@@ -14,21 +14,71 @@ The key insight: as context accumulates, Claude's quality degrades.
 Fresh subagent = fresh context = consistent quality.
 """
 
-import os
+import copy
+import functools
+import hashlib
 import json
-import subprocess
-import tempfile
+import os
+import re
+import sys
+import threading
 import time
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass, field
+from types import MappingProxyType
+
+# orjson (optional) serializes cache keys several times faster than json
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        """Canonical JSON bytes (sorted keys, str() fallback)."""
+        return orjson.dumps(
+            obj,
+            default=str,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        )
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        """Canonical JSON bytes (sorted keys, str() fallback)."""
+        return json.dumps(obj, sort_keys=True, default=str).encode()
+
+# tiktoken (optional) gives exact token counts for context budgeting;
+# without it tokens are estimated as chars / 4
+try:
+    import tiktoken
+    _TOKEN_ENCODING = tiktoken.get_encoding("cl100k_base")
+except (ImportError, ValueError):
+    _TOKEN_ENCODING = None
+
+# subprocess/tempfile are only needed when a CLI subagent is actually
+# spawned; they are imported there so the context builder and
+# pre-planner stay cheap to import.
+if TYPE_CHECKING:
+    import subprocess
 
 
 # =============================================================================
 # CONFIGURATION
 # =============================================================================
 
+# Default subagent context budget in tokens (override: VIBES_SUBAGENT_BUDGET)
+DEFAULT_CONTEXT_TOKENS = 150_000
+
+
+def _context_token_budget() -> int:
+    """VIBES_SUBAGENT_BUDGET, or the default when unset or not an integer."""
+    try:
+        return int(os.environ.get("VIBES_SUBAGENT_BUDGET", DEFAULT_CONTEXT_TOKENS))
+    except ValueError:
+        return DEFAULT_CONTEXT_TOKENS
+
+
 @dataclass
 class SubagentConfig:
     """Configuration for subagent spawning."""
@@ -36,6 +86,9 @@ class SubagentConfig:
     # Maximum context to pass to subagent (chars)
     max_context_chars: int = 50_000
     
+    # Token budget for the subagent context (VIBES_SUBAGENT_BUDGET)
+    max_context_tokens: int = field(default_factory=_context_token_budget)
+    
     # Timeout for subagent execution (seconds)
     timeout_seconds: int = 1800  # 30 minutes
     
@@ -47,6 +100,9 @@ class SubagentConfig:
     
     # Whether to stream output
     stream_output: bool = True
+    
+    # Maximum subagents running at once in spawn_many
+    max_parallel: int = 4
 
 
 # =============================================================================
@@ -161,13 +217,209 @@ When done, output: FEATURE_COMPLETE""",
 When done, output: FEATURE_COMPLETE""",
 }
 
+# Read-only view with interned keys: looked up on every spawn
+AGENT_TYPE_PROMPTS = MappingProxyType(
+    {sys.intern(k): v for k, v in AGENT_TYPE_PROMPTS.items()}
+)
+
 DEFAULT_AGENT_TYPE = "feature_agent"
 
+# Built-in CLI tools each agent type is launched with. Every tool
+# definition costs prompt tokens, so agents only get what their role needs.
+_CODING_TOOLS = frozenset({"Read", "Edit", "Write", "Glob", "Grep", "Bash"})
+_REVIEW_TOOLS = frozenset({"Read", "Glob", "Grep", "Bash"})
+
+AGENT_TYPE_TOOL_WHITELIST = MappingProxyType({
+    sys.intern(agent_type): tools
+    for agent_type, tools in {
+        "feature_agent": _CODING_TOOLS,
+        "refactor_agent": _CODING_TOOLS,
+        "e2e_test_agent": _CODING_TOOLS,
+        "integration_test_agent": _CODING_TOOLS,
+        "unit_test_agent": _CODING_TOOLS,
+        "test_runner_agent": _REVIEW_TOOLS,
+        "docker_agent": _CODING_TOOLS,
+        "ci_cd_agent": _CODING_TOOLS,
+        "deployment_agent": _CODING_TOOLS,
+        "monitoring_agent": _CODING_TOOLS,
+        "security_agent": _CODING_TOOLS,
+        "code_review_agent": _REVIEW_TOOLS,
+        "documentation_agent": frozenset({"Read", "Edit", "Write", "Glob", "Grep"}),
+    }.items()
+})
+
 
 # =============================================================================
 # CONTEXT BUILDER
 # =============================================================================
 
+_CONTEXT_TEMPLATE = (
+    "{agent_role}"
+    + "=" * 60 + "\n"
+    "FEATURE IMPLEMENTATION CONTEXT\n"
+    + "=" * 60 + "\n"
+    "\n"
+    "## YOUR TASK\n"
+    "\n"
+    "**Feature:** {name}\n"
+    "\n"
+    "{description}"
+    "{tests}"
+    "{decisions}"
+    "{snippets}"
+    "## INSTRUCTIONS\n"
+    "\n"
+    "1. Implement the feature to pass all test cases\n"
+    "2. Follow existing code patterns and conventions\n"
+    "3. Write clean, maintainable code\n"
+    "4. Run tests to verify your implementation\n"
+    "5. Commit your changes with a descriptive message\n"
+    "\n"
+    "When complete, output: FEATURE_COMPLETE\n"
+    "If blocked, output: FEATURE_BLOCKED: <reason>\n"
+)
+
+
+def _format_tests(test_cases: List[Any]) -> str:
+    """Render test cases as the success criteria section."""
+    if not test_cases:
+        return ""
+    lines = []
+    for i, tc in enumerate(test_cases, 1):
+        if isinstance(tc, dict):
+            lines.append(f"  {i}. {tc.get('name', tc)}\n")
+            if tc.get('steps'):
+                lines.append(f"     Steps: {tc['steps']}\n")
+            if tc.get('expected'):
+                lines.append(f"     Expected: {tc['expected']}\n")
+        else:
+            lines.append(f"  {i}. {tc}\n")
+    return "**Success Criteria (Tests to Pass):**\n" + "".join(lines) + "\n"
+
+
+def _format_decisions(decisions: Optional[List[str]]) -> str:
+    """Render key decisions (limited to the 10 most relevant)."""
+    if not decisions:
+        return ""
+    items = "".join(f"- {d}\n" for d in decisions[:10])
+    return f"## KEY DECISIONS (from task_plan.md)\n\n{items}\n"
+
+
+def _format_snippets(relevant_code: Optional[List[Dict[str, Any]]]) -> str:
+    """
+    Render relevant code snippets (limited to 5). Snippets marked as
+    references are listed by location only.
+    """
+    if not relevant_code:
+        return ""
+    blocks = "".join(
+        f"### {snippet.get('file', 'Unknown file')}\n"
+        f"Lines {snippet.get('start', '?')}-{snippet.get('end', '?')}"
+        + (
+            " (not inlined: read this range from the file)\n\n"
+            if snippet.get('reference') else
+            f"\n```\n{snippet.get('content', '')}\n```\n\n"
+        )
+        for snippet in relevant_code[:5]
+    )
+    return f"## RELEVANT EXISTING CODE\n\n{blocks}"
+
+
+# A decisions table: a header line mentioning "Decision" and containing
+# "|", followed by the run of lines that start with "|"
+_DECISION_TABLE_RE = re.compile(
+    r"^(?=[^\n]*Decision)(?=[^\n]*\|)[^\n]*(?:\n|\Z)((?:\|[^\n]*(?:\n|\Z))*)",
+    re.MULTILINE
+)
+# First non-empty cell of a table row, skipping separator ("---") rows
+# and repeated header rows
+_DECISION_ROW_RE = re.compile(
+    r"^\|(?![^\n]*(?:---|Decision))(?:[^\S\n]*\|)*[^\S\n]*([^|\s](?:[^|\n]*[^|\s])?)",
+    re.MULTILINE
+)
+
+
+def _parse_decisions(content: str) -> List[str]:
+    """
+    Collect the first non-empty cell of each row in the decisions
+    table(s) of task_plan.md, using the regex engine instead of a
+    Python-level loop over lines.
+    """
+    return [
+        row.group(1)
+        for table in _DECISION_TABLE_RE.finditer(content)
+        for row in _DECISION_ROW_RE.finditer(table.group(1))
+    ]
+
+
+# Words of three or more characters, used to rank snippets by relevance
+_WORD_RE = re.compile(r"[a-z0-9_]{3,}")
+
+
+def _rank_snippets(
+    feature: Dict[str, Any],
+    relevant_code: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """
+    Order snippets by how many distinct words of the feature name and
+    description they contain (most relevant first, stable on ties).
+    """
+    words = set(_WORD_RE.findall(
+        f"{feature.get('name', '')} {feature.get('description', '')}".lower()
+    ))
+    if not words:
+        return list(relevant_code)
+    
+    def score(snippet: Dict[str, Any]) -> int:
+        text = f"{snippet.get('file', '')} {snippet.get('content', '')}".lower()
+        return sum(1 for word in words if word in text)
+    
+    return sorted(relevant_code, key=score, reverse=True)
+
+
+class ContextBudget:
+    """
+    Token budget for a subagent context, keeping `reserve_tokens` free
+    for the subagent's own instructions and first turns.
+    """
+    
+    def __init__(self, max_tokens: int, reserve_tokens: int = 8000):
+        self.limit = max(0, max_tokens - reserve_tokens)
+        self.used = 0
+    
+    @staticmethod
+    def count(text: str) -> int:
+        """Tokens in text (tiktoken if available, else chars / 4)."""
+        if _TOKEN_ENCODING is not None:
+            return len(_TOKEN_ENCODING.encode(text, disallowed_special=()))
+        return (len(text) + 3) // 4
+    
+    def spend(self, tokens: int) -> bool:
+        """Reserve `tokens` if they fit; False (nothing spent) otherwise."""
+        if self.used + tokens > self.limit:
+            return False
+        self.used += tokens
+        return True
+
+
+# Tokens in the fixed parts of the context template
+_CONTEXT_TEMPLATE_TOKENS = ContextBudget.count(_CONTEXT_TEMPLATE)
+
+
+def _snippet_reference(snippet: Dict[str, Any]) -> Dict[str, Any]:
+    """A snippet reduced to its location (file and line range)."""
+    return {
+        "file": snippet.get("file", "Unknown file"),
+        "start": snippet.get("start", "?"),
+        "end": snippet.get("end", "?"),
+        "reference": True
+    }
+
+
+# Number of rendered contexts kept per builder
+_CONTEXT_CACHE_SIZE = 64
+
+
 class FeatureContextBuilder:
     """
     Builds minimal, focused context for a feature subagent.
@@ -181,12 +433,17 @@ class FeatureContextBuilder:
     
     def __init__(self, project_dir: Path):
         self.project_dir = Path(project_dir)
+        # (task_plan.md mtime, parsed decisions)
+        self._decisions_cache: Optional[Tuple[int, List[str]]] = None
+        # Input digest -> rendered context, least recently used first
+        self._context_cache: "OrderedDict[bytes, str]" = OrderedDict()
         
     def build_context(
         self,
         feature: Dict[str, Any],
         relevant_code: List[Dict[str, Any]] = None,
-        decisions: List[str] = None
+        decisions: List[str] = None,
+        agent_prompt: str = None
     ) -> str:
         """
         Build focused context for a feature.
@@ -195,102 +452,123 @@ class FeatureContextBuilder:
             feature: Feature dict with name, description, test_cases
             relevant_code: Code snippets from Aleph search
             decisions: Key decisions from task_plan.md
+            agent_prompt: Agent role prompt, emitted as the first section
             
         Returns:
             Formatted context string
         """
-        parts = []
-        
-        # Header
-        parts.append("=" * 60)
-        parts.append("FEATURE IMPLEMENTATION CONTEXT")
-        parts.append("=" * 60)
-        parts.append("")
-        
-        # Feature spec
-        parts.append("## YOUR TASK")
-        parts.append("")
-        parts.append(f"**Feature:** {feature.get('name', 'Unknown')}")
-        parts.append("")
-        if feature.get('description'):
-            parts.append(f"**Description:** {feature['description']}")
-            parts.append("")
-        
-        # Test cases
+        # Retries and multiple agent types often rebuild the same context;
+        # key on a digest of exactly the inputs that are rendered.
+        name = feature.get('name', 'Unknown')
+        description = feature.get('description')
         test_cases = feature.get('test_cases', [])
-        if test_cases:
-            parts.append("**Success Criteria (Tests to Pass):**")
-            for i, tc in enumerate(test_cases, 1):
-                if isinstance(tc, dict):
-                    parts.append(f"  {i}. {tc.get('name', tc)}")
-                    if tc.get('steps'):
-                        parts.append(f"     Steps: {tc['steps']}")
-                    if tc.get('expected'):
-                        parts.append(f"     Expected: {tc['expected']}")
-                else:
-                    parts.append(f"  {i}. {tc}")
-            parts.append("")
+        key = hashlib.blake2b(
+            _dumps([
+                agent_prompt,
+                name,
+                description,
+                test_cases,
+                decisions[:10] if decisions else None,
+                relevant_code[:5] if relevant_code else None
+            ]),
+            digest_size=16
+        ).digest()
         
-        # Key decisions
-        if decisions:
-            parts.append("## KEY DECISIONS (from task_plan.md)")
-            parts.append("")
-            for d in decisions[:10]:  # Limit to 10 most relevant
-                parts.append(f"- {d}")
-            parts.append("")
+        context = self._context_cache.get(key)
+        if context is not None:
+            self._context_cache.move_to_end(key)
+            return context
         
-        # Relevant code
+        context = self._render_context(
+            name, description, test_cases, relevant_code, decisions, agent_prompt
+        )
+        self._context_cache[key] = context
+        if len(self._context_cache) > _CONTEXT_CACHE_SIZE:
+            self._context_cache.popitem(last=False)
+        return context
+    
+    @staticmethod
+    def _render_context(
+        name: str,
+        description: Optional[str],
+        test_cases: List[Any],
+        relevant_code: Optional[List[Dict[str, Any]]],
+        decisions: Optional[List[str]],
+        agent_prompt: Optional[str] = None
+    ) -> str:
+        """Fill the context template (uncached)."""
+        return _CONTEXT_TEMPLATE.format(
+            agent_role=f"## AGENT ROLE\n{agent_prompt}\n\n" if agent_prompt else "",
+            name=name,
+            description=f"**Description:** {description}\n\n" if description else "",
+            tests=_format_tests(test_cases),
+            decisions=_format_decisions(decisions),
+            snippets=_format_snippets(relevant_code)
+        )
+    
+    def estimate_context_size(
+        self,
+        feature: Dict[str, Any],
+        relevant_code: List[Dict[str, Any]] = None,
+        decisions: List[str] = None
+    ) -> int:
+        """
+        Estimate len(build_context(...)) from the input sizes without
+        formatting anything.
+        """
+        size = len(_CONTEXT_TEMPLATE)
+        name = feature.get('name', '')
+        description = feature.get('description', '')
+        size += len(str(name)) + len(str(description))
+        size += sum(len(str(tc)) + 16 for tc in feature.get('test_cases', []))
+        if decisions:
+            size += sum(len(d) + 3 for d in decisions[:10])
         if relevant_code:
-            parts.append("## RELEVANT EXISTING CODE")
-            parts.append("")
-            for snippet in relevant_code[:5]:  # Limit to 5 snippets
-                parts.append(f"### {snippet.get('file', 'Unknown file')}")
-                parts.append(f"Lines {snippet.get('start', '?')}-{snippet.get('end', '?')}")
-                parts.append("```")
-                parts.append(snippet.get('content', ''))
-                parts.append("```")
-                parts.append("")
-        
-        # Instructions
-        parts.append("## INSTRUCTIONS")
-        parts.append("")
-        parts.append("1. Implement the feature to pass all test cases")
-        parts.append("2. Follow existing code patterns and conventions")
-        parts.append("3. Write clean, maintainable code")
-        parts.append("4. Run tests to verify your implementation")
-        parts.append("5. Commit your changes with a descriptive message")
-        parts.append("")
-        parts.append("When complete, output: FEATURE_COMPLETE")
-        parts.append("If blocked, output: FEATURE_BLOCKED: <reason>")
-        parts.append("")
-        
-        return "\n".join(parts)
+            size += sum(
+                len(snippet.get('content', '')) + len(snippet.get('file', '')) + 32
+                for snippet in relevant_code[:5]
+            )
+        return size
+    
+    def count_base_tokens(
+        self,
+        feature: Dict[str, Any],
+        decisions: List[str] = None,
+        agent_prompt: str = None
+    ) -> int:
+        """
+        Tokens build_context(...) spends before any code snippets, counted
+        from its parts so the context is not rendered just to be measured.
+        """
+        return (
+            _CONTEXT_TEMPLATE_TOKENS
+            + ContextBudget.count(agent_prompt or "")
+            + ContextBudget.count(str(feature.get('name', 'Unknown')))
+            + ContextBudget.count(str(feature.get('description') or ""))
+            + ContextBudget.count(_format_tests(feature.get('test_cases', [])))
+            + ContextBudget.count(_format_decisions(decisions))
+        )
     
     def extract_decisions(self) -> List[str]:
-        """Extract key decisions from task_plan.md."""
+        """
+        Extract key decisions from task_plan.md.
+        
+        The parsed result is cached until the file's mtime changes, so a
+        batch of spawns reads and parses the plan only once.
+        """
         task_plan = self.project_dir / "task_plan.md"
         
-        if not task_plan.exists():
+        try:
+            mtime = task_plan.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._decisions_cache = None
             return []
         
-        content = task_plan.read_text()
-        decisions = []
-        
-        # Look for decisions table or section
-        in_decisions = False
-        for line in content.splitlines():
-            if "Decision" in line and "|" in line:
-                in_decisions = True
-                continue
-            if in_decisions:
-                if line.startswith("|") and "---" not in line:
-                    # Parse table row
-                    parts = [p.strip() for p in line.split("|") if p.strip()]
-                    if parts and parts[0]:
-                        decisions.append(parts[0])
-                elif not line.startswith("|"):
-                    in_decisions = False
+        if self._decisions_cache and self._decisions_cache[0] == mtime:
+            return self._decisions_cache[1]
         
+        decisions = _parse_decisions(task_plan.read_text())
+        self._decisions_cache = (mtime, decisions)
         return decisions
 
 
@@ -316,7 +594,8 @@ class SubagentSpawner:
         self.project_dir = Path(project_dir)
         self.config = config or SubagentConfig()
         self.context_builder = FeatureContextBuilder(project_dir)
-        self._active_process: Optional[subprocess.Popen] = None
+        self._active_process: Optional["subprocess.Popen"] = None
+        self._async_processes: set = set()  # running spawn_many subagents
         
     def spawn_for_feature(
         self,
@@ -338,114 +617,344 @@ class SubagentSpawner:
             Result dict with status, output, duration
         """
         start_time = time.time()
-
-        # Get agent type prompt
-        agent_type = agent_type or DEFAULT_AGENT_TYPE
-        agent_prompt = AGENT_TYPE_PROMPTS.get(agent_type, AGENT_TYPE_PROMPTS[DEFAULT_AGENT_TYPE])
-
-        # Build focused context
-        decisions = self.context_builder.extract_decisions()
-        context = self.context_builder.build_context(
-            feature=feature,
-            relevant_code=relevant_code,
-            decisions=decisions
-        )
-
-        # Prepend agent type prompt to context
-        context = f"## AGENT ROLE\n{agent_prompt}\n\n{context}"
-
-        # Check context size
-        if len(context) > self.config.max_context_chars:
-            # Truncate relevant code first
-            context = self.context_builder.build_context(
-                feature=feature,
-                relevant_code=relevant_code[:2] if relevant_code else None,
-                decisions=decisions[:5]
-            )
-            context = f"## AGENT ROLE\n{agent_prompt}\n\n{context}"
+        context, budget_used = self._prepare_context(feature, relevant_code, agent_type)
 
         # Spawn subagent
         if self.config.use_cli:
-            result = self._spawn_cli_subagent(context, on_output)
+            result = self._spawn_cli_subagent(
+                context, on_output, self._agent_tools(agent_type)
+            )
         else:
             result = self._spawn_sdk_subagent(context, on_output)
         
         result['duration_seconds'] = time.time() - start_time
         result['feature_id'] = feature.get('id')
         result['feature_name'] = feature.get('name')
+        result['budget_used'] = budget_used
+        
+        return result
+    
+    async def spawn_for_feature_async(
+        self,
+        feature: Dict[str, Any],
+        relevant_code: List[Dict[str, Any]] = None,
+        on_output: callable = None,
+        agent_type: str = None
+    ) -> Dict[str, Any]:
+        """
+        spawn_for_feature without blocking the event loop.
+        
+        CLI subagents run as asyncio subprocesses; the SDK client is
+        blocking, so it is moved to a worker thread.
+        """
+        import asyncio
+        
+        start_time = time.time()
+        context, budget_used = self._prepare_context(feature, relevant_code, agent_type)
+        
+        if self.config.use_cli:
+            result = await self._spawn_cli_subagent_async(
+                context, on_output, tools=self._agent_tools(agent_type)
+            )
+        else:
+            result = await asyncio.to_thread(
+                self._spawn_sdk_subagent, context, on_output
+            )
+        
+        result['duration_seconds'] = time.time() - start_time
+        result['feature_id'] = feature.get('id')
+        result['feature_name'] = feature.get('name')
+        result['budget_used'] = budget_used
         
         return result
     
+    async def spawn_batch(
+        self,
+        spawns: List[Dict[str, Any]],
+        on_output: callable = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Spawn one subagent per entry concurrently, at most
+        config.max_parallel at a time.
+        
+        Args:
+            spawns: Dicts with feature and optional relevant_code, agent_type
+            on_output: Callback for streaming output
+            
+        Returns:
+            Result dicts in the order of `spawns`
+        """
+        import asyncio
+        
+        semaphore = asyncio.Semaphore(max(1, self.config.max_parallel))
+        
+        async def run_one(spawn: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.spawn_for_feature_async(
+                    spawn["feature"],
+                    spawn.get("relevant_code"),
+                    on_output,
+                    spawn.get("agent_type")
+                )
+        
+        return list(await asyncio.gather(*(run_one(s) for s in spawns)))
+    
+    async def spawn_agents_batch(
+        self,
+        shared_context: str,
+        forks: List[Dict[str, Any]],
+        on_output: callable = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Spawn N subagents that share one large context prefix and differ
+        only in a small per-fork payload.
+        
+        The shared context is written once and handed to every CLI fork
+        as the same appended system prompt, so the provider's prompt
+        cache serves it after the first fork instead of re-reading it N
+        times. SDK subagents get the shared context prepended.
+        
+        Args:
+            shared_context: Prefix common to all forks (role, repo context)
+            forks: Dicts with id and payload (the fork-specific context)
+            on_output: Callback for streaming output
+            
+        Returns:
+            Result dicts (with fork_id) in the order of `forks`
+        """
+        import asyncio
+        
+        semaphore = asyncio.Semaphore(max(1, self.config.max_parallel))
+        shared_file = self._write_context_file(shared_context) if self.config.use_cli else None
+        
+        async def run_one(fork: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                start_time = time.time()
+                if shared_file:
+                    result = await self._spawn_cli_subagent_async(
+                        fork.get("payload", ""), on_output, shared_file
+                    )
+                else:
+                    result = await asyncio.to_thread(
+                        self._spawn_sdk_subagent,
+                        f"{shared_context}\n\n{fork.get('payload', '')}",
+                        on_output
+                    )
+                result['duration_seconds'] = time.time() - start_time
+                result['fork_id'] = fork.get('id')
+                return result
+        
+        try:
+            return list(await asyncio.gather(*(run_one(f) for f in forks)))
+        finally:
+            if shared_file:
+                os.unlink(shared_file)
+    
+    async def spawn_many(
+        self,
+        features: List[Dict[str, Any]],
+        relevant_code: List[Dict[str, Any]] = None,
+        on_output: callable = None,
+        agent_type: str = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Spawn one subagent per feature concurrently, sharing
+        relevant_code and agent_type.
+        
+        Subagents are I/O-bound subprocesses, so a batch finishes in
+        roughly the time of its slowest features instead of the sum.
+        Results are returned in the order of `features`.
+        """
+        return await self.spawn_batch(
+            [
+                {"feature": f, "relevant_code": relevant_code, "agent_type": agent_type}
+                for f in features
+            ],
+            on_output
+        )
+    
+    def spawn_features(
+        self,
+        features: List[Dict[str, Any]],
+        relevant_code: List[Dict[str, Any]] = None,
+        agent_type: str = None
+    ) -> List[Dict[str, Any]]:
+        """Synchronous wrapper around spawn_many."""
+        import asyncio
+        
+        return asyncio.run(
+            self.spawn_many(features, relevant_code, agent_type=agent_type)
+        )
+    
+    def _prepare_context(
+        self,
+        feature: Dict[str, Any],
+        relevant_code: Optional[List[Dict[str, Any]]],
+        agent_type: Optional[str]
+    ) -> Tuple[str, int]:
+        """
+        Build the full subagent context, including the agent role.
+        
+        Returns:
+            (context, estimated tokens used)
+        """
+        # Get agent type prompt
+        agent_type = sys.intern(agent_type or DEFAULT_AGENT_TYPE)
+        agent_prompt = AGENT_TYPE_PROMPTS.get(agent_type, AGENT_TYPE_PROMPTS[DEFAULT_AGENT_TYPE])
+
+        # Check context size up front: trim decisions if the context is
+        # over budget even without code
+        decisions = self.context_builder.extract_decisions()
+        char_budget = self.config.max_context_chars * 0.9
+        chars = len(agent_prompt) + self.context_builder.estimate_context_size(
+            feature, None, decisions
+        )
+        if chars > char_budget:
+            decisions = decisions[:5]
+            chars = len(agent_prompt) + self.context_builder.estimate_context_size(
+                feature, None, decisions
+            )
+
+        budget = ContextBudget(self.config.max_context_tokens)
+        budget.spend(self.context_builder.count_base_tokens(
+            feature, decisions, agent_prompt
+        ))
+
+        # Inline the most relevant snippets while they fit both budgets;
+        # the rest are passed as file/line references
+        if relevant_code:
+            fitted = []
+            for snippet in _rank_snippets(feature, relevant_code)[:5]:
+                content = snippet.get('content', '')
+                size = len(content) + len(snippet.get('file', '')) + 32
+                if chars + size <= char_budget and budget.spend(
+                    budget.count(content) + 16
+                ):
+                    chars += size
+                    fitted.append(snippet)
+                else:
+                    fitted.append(_snippet_reference(snippet))
+            relevant_code = fitted
+
+        # Build focused context, led by the agent type prompt
+        context = self.context_builder.build_context(
+            feature=feature,
+            relevant_code=relevant_code,
+            decisions=decisions,
+            agent_prompt=agent_prompt
+        )
+        return context, budget.used
+    
+    @staticmethod
+    def _agent_tools(agent_type: Optional[str]) -> frozenset:
+        """Whitelisted CLI tools for an agent type."""
+        return AGENT_TYPE_TOOL_WHITELIST.get(
+            agent_type or DEFAULT_AGENT_TYPE,
+            AGENT_TYPE_TOOL_WHITELIST[DEFAULT_AGENT_TYPE]
+        )
+    
+    @staticmethod
+    def _write_context_file(context: str) -> str:
+        """Write context to a temp .md file in bounded slices; return its path."""
+        import tempfile
+        
+        fd, context_file = tempfile.mkstemp(suffix='.md')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                for i in range(0, len(context), 65536):
+                    f.write(context[i:i + 65536])
+        except BaseException:
+            os.unlink(context_file)
+            raise
+        return context_file
+    
+    @staticmethod
+    def _cli_command(
+        context_file: str,
+        shared_file: Optional[str] = None,
+        tools: Optional[frozenset] = None
+    ) -> List[str]:
+        """
+        Claude CLI invocation for a context file.
+        
+        A shared_file is passed as an appended system prompt so every fork
+        of a batch starts with the same cacheable prefix. `tools` limits
+        the built-in tools the subagent is given.
+        """
+        cmd = [
+            "claude",
+            "--print",  # Non-interactive mode
+            "--dangerously-skip-permissions",  # Auto-approve tool use
+        ]
+        if tools:
+            cmd += ["--tools", ",".join(sorted(tools))]
+        if shared_file:
+            cmd += ["--append-system-prompt-file", shared_file]
+        cmd += [
+            "-p", f"Read the context file at {context_file} and implement the feature as specified."
+        ]
+        return cmd
+    
     def _spawn_cli_subagent(
         self, 
         context: str, 
-        on_output: callable = None
+        on_output: callable = None,
+        tools: Optional[frozenset] = None
     ) -> Dict[str, Any]:
         """Spawn subagent using Claude CLI."""
+        import subprocess
         
-        # Write context to temp file
-        with tempfile.NamedTemporaryFile(
-            mode='w', 
-            suffix='.md', 
-            delete=False
-        ) as f:
-            f.write(context)
-            context_file = f.name
+        context_file = self._write_context_file(context)
         
         try:
             # Build command
-            cmd = [
-                "claude",
-                "--print",  # Non-interactive mode
-                "--dangerously-skip-permissions",  # Auto-approve tool use
-                "-p", f"Read the context file at {context_file} and implement the feature as specified."
-            ]
+            cmd = self._cli_command(context_file, tools=tools)
             
             # Add working directory
             env = os.environ.copy()
             
-            # Spawn process
+            # Spawn process (binary pipes: output is decoded once)
             process = subprocess.Popen(
                 cmd,
                 cwd=str(self.project_dir),
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
                 env=env
             )
             self._active_process = process
             
             # Collect output
-            output_lines = []
+            output = bytearray()
             status = "running"
             
             try:
                 # Stream output if callback provided
                 if on_output and self.config.stream_output:
-                    for line in iter(process.stdout.readline, ''):
-                        output_lines.append(line)
-                        on_output(line)
-                        
-                        # Check for completion markers
-                        if "FEATURE_COMPLETE" in line:
-                            status = "complete"
-                        elif "FEATURE_BLOCKED" in line:
-                            status = "blocked"
-                    
+                    self._stream_output(process, output, on_output)
                     process.wait(timeout=self.config.timeout_seconds)
+                    
+                    # Last completion marker wins
+                    complete_at = output.rfind(b"FEATURE_COMPLETE")
+                    blocked_at = output.rfind(b"FEATURE_BLOCKED")
+                    if complete_at > blocked_at:
+                        status = "complete"
+                    elif blocked_at != -1:
+                        status = "blocked"
                 else:
                     stdout, stderr = process.communicate(
                         timeout=self.config.timeout_seconds
                     )
-                    output_lines = stdout.splitlines()
+                    output += stdout
                     
-                    if "FEATURE_COMPLETE" in stdout:
+                    if b"FEATURE_COMPLETE" in stdout:
                         status = "complete"
-                    elif "FEATURE_BLOCKED" in stdout:
+                    elif b"FEATURE_BLOCKED" in stdout:
                         status = "blocked"
                     elif process.returncode != 0:
                         status = "error"
-                        output_lines.extend(stderr.splitlines())
+                        if output and not output.endswith(b"\n"):
+                            output += b"\n"
+                        output += stderr
                     else:
                         status = "complete"  # Assume complete if no error
                         
@@ -455,7 +964,7 @@ class SubagentSpawner:
                 
             return {
                 "status": status,
-                "output": "\n".join(output_lines),
+                "output": output.decode("utf-8", errors="replace").rstrip("\n"),
                 "return_code": process.returncode
             }
             
@@ -464,6 +973,119 @@ class SubagentSpawner:
             os.unlink(context_file)
             self._active_process = None
     
+    @staticmethod
+    def _stream_output(
+        process: "subprocess.Popen",
+        output: bytearray,
+        on_output: callable
+    ) -> None:
+        """
+        Read stdout in 64KB chunks into `output`, passing complete lines
+        to on_output as they arrive.
+        """
+        fd = process.stdout.fileno()
+        pending = bytearray()
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
+            output += chunk
+            SubagentSpawner._feed_lines(pending, chunk, on_output)
+        if pending:
+            on_output(pending.decode("utf-8", errors="replace"))
+    
+    @staticmethod
+    def _feed_lines(pending: bytearray, chunk: bytes, on_output: callable) -> None:
+        """Append chunk to pending and pass any complete lines to on_output."""
+        pending += chunk
+        end = pending.rfind(b"\n")
+        if end != -1:
+            text = pending[:end + 1].decode("utf-8", errors="replace")
+            for line in text.splitlines(keepends=True):
+                on_output(line)
+            del pending[:end + 1]
+    
+    async def _spawn_cli_subagent_async(
+        self,
+        context: str,
+        on_output: callable = None,
+        shared_file: Optional[str] = None,
+        tools: Optional[frozenset] = None
+    ) -> Dict[str, Any]:
+        """Spawn subagent using Claude CLI without blocking the event loop."""
+        import asyncio
+        
+        context_file = self._write_context_file(context)
+        
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *self._cli_command(context_file, shared_file, tools),
+                cwd=str(self.project_dir),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+            self._async_processes.add(process)
+            
+            output = bytearray()
+            stream = on_output if on_output and self.config.stream_output else None
+            
+            async def read_stdout() -> None:
+                pending = bytearray()
+                while True:
+                    chunk = await process.stdout.read(65536)
+                    if not chunk:
+                        break
+                    output.extend(chunk)
+                    if stream:
+                        self._feed_lines(pending, chunk, stream)
+                if stream and pending:
+                    stream(pending.decode("utf-8", errors="replace"))
+            
+            try:
+                _, stderr = await asyncio.wait_for(
+                    asyncio.gather(read_stdout(), process.stderr.read()),
+                    timeout=self.config.timeout_seconds
+                )
+                await process.wait()
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                status = "timeout"
+            else:
+                # Last completion marker wins
+                complete_at = output.rfind(b"FEATURE_COMPLETE")
+                blocked_at = output.rfind(b"FEATURE_BLOCKED")
+                if complete_at > blocked_at:
+                    status = "complete"
+                elif blocked_at != -1:
+                    status = "blocked"
+                elif process.returncode != 0:
+                    status = "error"
+                    if output and not output.endswith(b"\n"):
+                        output += b"\n"
+                    output += stderr
+                else:
+                    status = "complete"  # Assume complete if no error
+            
+            return {
+                "status": status,
+                "output": output.decode("utf-8", errors="replace").rstrip("\n"),
+                "return_code": process.returncode
+            }
+        
+        except FileNotFoundError:
+            return {
+                "status": "error",
+                "output": "Claude CLI not available",
+                "return_code": 127
+            }
+        
+        finally:
+            os.unlink(context_file)
+            self._async_processes = {
+                p for p in self._async_processes if p.returncode is None
+            }
+    
     def _spawn_sdk_subagent(
         self, 
         context: str, 
@@ -515,18 +1137,271 @@ class SubagentSpawner:
             }
     
     def cancel(self) -> bool:
-        """Cancel the active subagent if running."""
+        """Cancel the active subagent(s) if running."""
+        cancelled = False
         if self._active_process:
             self._active_process.terminate()
             self._active_process = None
-            return True
-        return False
+            cancelled = True
+        for process in self._async_processes:
+            if process.returncode is None:
+                process.terminate()
+                cancelled = True
+        return cancelled
+
+
+# =============================================================================
+# SUBAGENT REGISTRY (background spawns)
+# =============================================================================
+
+@dataclass
+class SubagentTask:
+    """A subagent running (or queued) in the background."""
+    id: str
+    feature: Dict[str, Any]
+    agent_type: Optional[str]
+    spawner: SubagentSpawner
+    future: Optional[Future] = None
+    started_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+    cancelled: bool = False
+    running: bool = False
+    output: deque = field(default_factory=lambda: deque(maxlen=200))
+    
+    @property
+    def status(self) -> str:
+        """pending, running, completed, failed or cancelled."""
+        if self.future is None:
+            return "pending"
+        if self.cancelled or self.future.cancelled():
+            return "cancelled"
+        if not self.future.done():
+            return "running" if self.running else "pending"
+        if self.future.exception():
+            return "failed"
+        # Spawn methods report failures and timeouts in the result
+        result = self.future.result()
+        return "failed" if result.get("status") == "error" else "completed"
+    
+    def to_dict(self, include_result: bool = False) -> Dict[str, Any]:
+        """Status summary, with the last lines of output."""
+        end = self.finished_at or time.time()
+        info = {
+            "session_id": self.id,
+            "feature_id": self.feature.get('id'),
+            "feature_name": self.feature.get('name'),
+            "agent_type": self.agent_type or DEFAULT_AGENT_TYPE,
+            "status": self.status,
+            "elapsed_seconds": round(end - self.started_at, 1),
+            "output_tail": "".join(list(self.output)[-20:])
+        }
+        future = self.future
+        if include_result and future is not None and future.done() and not future.cancelled():
+            if future.exception():
+                info["error"] = str(future.exception())
+            else:
+                info["result"] = future.result()
+        return info
+
+
+class SubagentRegistry:
+    """
+    Runs subagents on a thread pool so the caller can keep working and
+    poll for status instead of blocking until the subagent exits.
+    
+    Finished tasks are forgotten after `ttl_seconds`.
+    """
+    
+    def __init__(self, max_concurrent: int = 10, ttl_seconds: int = 3600):
+        self.ttl_seconds = ttl_seconds
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrent, thread_name_prefix="subagent"
+        )
+        self._tasks: Dict[str, SubagentTask] = {}
+        self._lock = threading.Lock()
+    
+    def submit(
+        self,
+        spawner: SubagentSpawner,
+        feature: Dict[str, Any],
+        relevant_code: List[Dict[str, Any]] = None,
+        agent_type: str = None
+    ) -> SubagentTask:
+        """Queue a subagent for `feature` and return its task."""
+        # Each task gets its own shallow copy so its process can be
+        # tracked (and cancelled) separately; config and the context
+        # builder's caches stay shared, process tracking does not.
+        task_spawner = copy.copy(spawner)
+        task_spawner._active_process = None
+        task_spawner._async_processes = set()
+        task = SubagentTask(
+            id=uuid.uuid4().hex,
+            feature=feature,
+            agent_type=agent_type,
+            spawner=task_spawner
+        )
+        
+        def run() -> Dict[str, Any]:
+            task.running = True
+            try:
+                return task.spawner.spawn_for_feature(
+                    feature, relevant_code, task.output.append, agent_type
+                )
+            finally:
+                task.finished_at = time.time()
+        
+        with self._lock:
+            self._cleanup()
+            self._tasks[task.id] = task
+            task.future = self._executor.submit(run)
+        return task
+    
+    def get(self, task_id: str) -> Optional[SubagentTask]:
+        """Look up a task by id."""
+        with self._lock:
+            return self._tasks.get(task_id)
+    
+    def list(self) -> List[SubagentTask]:
+        """All tasks not yet expired, oldest first."""
+        with self._lock:
+            self._cleanup()
+            return list(self._tasks.values())
+    
+    def cancel(self, task_id: str) -> bool:
+        """Cancel a queued task or terminate a running one."""
+        task = self.get(task_id)
+        if task is None or task.future is None or task.future.done():
+            return False
+        if task.future.cancel():
+            task.finished_at = time.time()
+            task.cancelled = True
+        else:
+            task.cancelled = task.spawner.cancel()
+        return task.cancelled
+    
+    def shutdown(self) -> None:
+        """Cancel everything and stop the worker threads."""
+        with self._lock:
+            tasks = list(self._tasks.values())
+        for task in tasks:
+            self.cancel(task.id)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _cleanup(self) -> None:
+        """Drop finished tasks older than the TTL (caller holds the lock)."""
+        cutoff = time.time() - self.ttl_seconds
+        expired = [
+            task_id for task_id, task in self._tasks.items()
+            if task.finished_at is not None and task.finished_at < cutoff
+        ]
+        for task_id in expired:
+            del self._tasks[task_id]
 
 
 # =============================================================================
 # PRE-PLANNING PHASE (borrowed from GSD)
 # =============================================================================
 
+# Trigger words for pre-planning analysis, matched as substrings of the
+# lowercased feature text (so "auth" also hits "authentication")
+_AUTH_WORDS = frozenset({'auth', 'login', 'user'})
+_API_WORDS = frozenset({'api', 'endpoint', 'route'})
+_DATA_WORDS = frozenset({'database', 'store', 'save', 'persist'})
+_UI_WORDS = frozenset({'ui', 'component', 'page', 'form'})
+_OAUTH_WORDS = frozenset({'oauth', 'sso', 'saml'})
+_PAYMENT_WORDS = frozenset({'stripe', 'payment', 'checkout'})
+_REALTIME_WORDS = frozenset({'websocket', 'realtime', 'live'})
+_UPLOAD_WORDS = frozenset({'s3', 'upload', 'storage', 'file'})
+_NEXTJS_WORDS = frozenset({'next', 'nextjs', 'next.js'})
+_REACT_WORDS = frozenset({'react', 'component', 'hook'})
+_ORM_WORDS = frozenset({'prisma', 'database', 'orm'})
+_STYLING_WORDS = frozenset({'tailwind', 'css', 'styling'})
+_VALIDATION_WORDS = frozenset({'zod', 'validation', 'schema'})
+
+
+_TRIGGER_WORDS = frozenset().union(
+    _AUTH_WORDS, _API_WORDS, _DATA_WORDS, _UI_WORDS, _OAUTH_WORDS,
+    _PAYMENT_WORDS, _REALTIME_WORDS, _UPLOAD_WORDS, _NEXTJS_WORDS,
+    _REACT_WORDS, _ORM_WORDS, _STYLING_WORDS, _VALIDATION_WORDS,
+    {'test'}
+)
+
+# One scan finds every trigger: the lookahead matches at each position
+# (so overlapping words like "oauth"/"auth" are both seen) and the
+# longest-first alternation picks the longest word starting there;
+# shorter words that are prefixes of it come from _TRIGGER_PREFIXES.
+_TRIGGER_RE = re.compile(
+    "(?=(" + "|".join(
+        re.escape(word) for word in sorted(_TRIGGER_WORDS, key=len, reverse=True)
+    ) + "))"
+)
+_TRIGGER_PREFIXES = {
+    word: frozenset(w for w in _TRIGGER_WORDS if word.startswith(w))
+    for word in _TRIGGER_WORDS
+}
+
+
+@dataclass(frozen=True)
+class FeatureSignals:
+    """Pre-planning analysis input shared by discuss/assumptions/research."""
+    text: str  # lowercased "<name> <description>"
+    triggers: frozenset  # trigger words occurring in text
+
+
+def _feature_signals(name: str, description: str) -> FeatureSignals:
+    """Scan the feature text once for all trigger words."""
+    text = f"{name} {description}".lower()
+    hits = set()
+    for match in _TRIGGER_RE.finditer(text):
+        hits.update(_TRIGGER_PREFIXES[match.group(1)])
+    return FeatureSignals(text=text, triggers=frozenset(hits))
+
+
+def _mentions(triggers: frozenset, words: frozenset) -> bool:
+    """True if any of `words` was found in the feature text."""
+    return not triggers.isdisjoint(words)
+
+
+# Assumption blocks shared by every list_assumptions() result. Each
+# result gets its own shallow copy of the dict; the tuples inside can't
+# be mutated, so the templates stay intact.
+_TECH_STACK_ASSUMPTIONS = {
+    "category": "Tech Stack",
+    "assumptions": (
+        "Using the existing framework/language in the project",
+        "Following existing code style and patterns",
+        "Using existing dependencies where possible"
+    )
+}
+
+_ARCHITECTURE_ASSUMPTIONS = {
+    "category": "Architecture",
+    "assumptions": (
+        "New code goes in standard locations (src/, lib/, etc.)",
+        "Following existing module/component patterns",
+        "Using existing utility functions"
+    )
+}
+
+_AUTH_ASSUMPTIONS = (
+    "JWT-based authentication (unless specified otherwise)",
+    "Passwords hashed with bcrypt",
+    "HttpOnly cookies for token storage"
+)
+
+_API_ASSUMPTIONS = (
+    "RESTful conventions (unless GraphQL exists)",
+    "JSON request/response bodies",
+    "Standard HTTP status codes"
+)
+
+_TEST_ASSUMPTIONS = (
+    "Using existing test framework",
+    "Unit tests alongside implementation",
+    "Mocking external dependencies"
+)
+
+
 class PrePlanningPhase:
     """
     Pre-planning phase before feature implementation.
@@ -544,6 +1419,19 @@ class PrePlanningPhase:
         self._discussions: Dict[int, List[Dict]] = {}
         self._assumptions: Dict[int, List[str]] = {}
         self._research: Dict[int, Dict] = {}
+        self._signal_cache: Dict[Tuple[str, str], FeatureSignals] = {}
+    
+    def _signals(self, name: str, description: str) -> FeatureSignals:
+        """
+        Signals for a feature, computed on first use and shared by the
+        discuss/assumptions/research calls of a pre-planning sequence.
+        Keyed by content so an edited feature is re-analyzed.
+        """
+        key = (name, description)
+        signals = self._signal_cache.get(key)
+        if signals is None:
+            signals = self._signal_cache[key] = _feature_signals(*key)
+        return signals
         
     def discuss_feature(
         self, 
@@ -567,10 +1455,12 @@ class PrePlanningPhase:
             Discussion summary with questions and considerations
         """
         feature_id = feature.get('id', 0)
+        name = feature.get('name')
+        description = feature.get('description', '')
         
         # Generate discussion points
         discussion = {
-            "feature": feature.get('name'),
+            "feature": name,
             "timestamp": datetime.now().isoformat(),
             "questions": [],
             "considerations": [],
@@ -579,11 +1469,10 @@ class PrePlanningPhase:
         }
         
         # Analyze feature for discussion points
-        name = feature.get('name', '').lower()
-        desc = feature.get('description', '').lower()
+        triggers = self._signals(name or '', description).triggers
         
         # Common patterns that need clarification
-        if any(word in name + desc for word in ['auth', 'login', 'user']):
+        if _mentions(triggers, _AUTH_WORDS):
             discussion['questions'].extend([
                 "What authentication method? (JWT, session, OAuth)",
                 "Password requirements?",
@@ -593,14 +1482,14 @@ class PrePlanningPhase:
                 "Security: rate limiting, password hashing, token expiry"
             )
         
-        if any(word in name + desc for word in ['api', 'endpoint', 'route']):
+        if _mentions(triggers, _API_WORDS):
             discussion['questions'].extend([
                 "Request/response format?",
                 "Error response structure?",
                 "Rate limiting requirements?"
             ])
             
-        if any(word in name + desc for word in ['database', 'store', 'save', 'persist']):
+        if _mentions(triggers, _DATA_WORDS):
             discussion['questions'].extend([
                 "Data model/schema?",
                 "Validation rules?",
@@ -608,7 +1497,7 @@ class PrePlanningPhase:
             ])
             discussion['dependencies'].append("Database schema must exist")
             
-        if any(word in name + desc for word in ['ui', 'component', 'page', 'form']):
+        if _mentions(triggers, _UI_WORDS):
             discussion['questions'].extend([
                 "Responsive design requirements?",
                 "Accessibility requirements?",
@@ -644,55 +1533,26 @@ class PrePlanningPhase:
             List of assumptions that should be validated
         """
         feature_id = feature.get('id', 0)
+        name = feature.get('name')
+        description = feature.get('description', '')
         
-        assumptions = []
-        name = feature.get('name', '').lower()
-        desc = feature.get('description', '').lower()
+        triggers = self._signals(name or '', description).triggers
         test_cases = feature.get('test_cases', [])
         
-        # Tech stack assumptions
-        assumptions.append({
-            "category": "Tech Stack",
-            "assumptions": [
-                "Using the existing framework/language in the project",
-                "Following existing code style and patterns",
-                "Using existing dependencies where possible"
-            ]
-        })
-        
-        # Architecture assumptions
-        assumptions.append({
-            "category": "Architecture",
-            "assumptions": [
-                "New code goes in standard locations (src/, lib/, etc.)",
-                "Following existing module/component patterns",
-                "Using existing utility functions"
-            ]
-        })
+        # Tech stack and architecture assumptions are the same for every feature
+        assumptions = [dict(_TECH_STACK_ASSUMPTIONS), dict(_ARCHITECTURE_ASSUMPTIONS)]
         
         # Feature-specific assumptions
         feature_assumptions = []
         
-        if 'auth' in name + desc:
-            feature_assumptions.extend([
-                "JWT-based authentication (unless specified otherwise)",
-                "Passwords hashed with bcrypt",
-                "HttpOnly cookies for token storage"
-            ])
+        if 'auth' in triggers:
+            feature_assumptions.extend(_AUTH_ASSUMPTIONS)
         
-        if 'api' in name + desc:
-            feature_assumptions.extend([
-                "RESTful conventions (unless GraphQL exists)",
-                "JSON request/response bodies",
-                "Standard HTTP status codes"
-            ])
+        if 'api' in triggers:
+            feature_assumptions.extend(_API_ASSUMPTIONS)
             
-        if 'test' in name + desc or test_cases:
-            feature_assumptions.extend([
-                "Using existing test framework",
-                "Unit tests alongside implementation",
-                "Mocking external dependencies"
-            ])
+        if 'test' in triggers or test_cases:
+            feature_assumptions.extend(_TEST_ASSUMPTIONS)
             
         if feature_assumptions:
             assumptions.append({
@@ -704,7 +1564,7 @@ class PrePlanningPhase:
         self._assumptions[feature_id] = assumptions
         
         return {
-            "feature": feature.get('name'),
+            "feature": name,
             "assumptions": assumptions,
             "action_required": "Review and correct any wrong assumptions before /execute"
         }
@@ -727,9 +1587,11 @@ class PrePlanningPhase:
             Research findings with libraries to fetch docs for
         """
         feature_id = feature.get('id', 0)
+        name = feature.get('name')
+        description = feature.get('description', '')
         
         research = {
-            "feature": feature.get('name'),
+            "feature": name,
             "timestamp": datetime.now().isoformat(),
             "topics_to_research": [],
             "libraries_to_fetch": [],  # For Context7
@@ -737,57 +1599,56 @@ class PrePlanningPhase:
             "resources": []
         }
         
-        name = feature.get('name', '').lower()
-        desc = feature.get('description', '').lower()
+        triggers = self._signals(name or '', description).triggers
         
         # Identify research topics AND libraries for Context7
-        if any(word in name + desc for word in ['oauth', 'sso', 'saml']):
+        if _mentions(triggers, _OAUTH_WORDS):
             research['topics_to_research'].append("OAuth 2.0 / OIDC flow specifics")
             research['libraries_to_fetch'].extend([
                 {"name": "next-auth", "topic": "oauth providers"},
                 {"name": "passport", "topic": "oauth strategy"}
             ])
             
-        if any(word in name + desc for word in ['stripe', 'payment', 'checkout']):
+        if _mentions(triggers, _PAYMENT_WORDS):
             research['topics_to_research'].append("Payment provider SDK integration")
             research['libraries_to_fetch'].append(
                 {"name": "stripe", "topic": "checkout sessions"}
             )
             
-        if any(word in name + desc for word in ['websocket', 'realtime', 'live']):
+        if _mentions(triggers, _REALTIME_WORDS):
             research['topics_to_research'].append("WebSocket implementation patterns")
             research['libraries_to_fetch'].extend([
                 {"name": "socket.io", "topic": "server setup"},
                 {"name": "ws", "topic": "websocket server"}
             ])
             
-        if any(word in name + desc for word in ['s3', 'upload', 'storage', 'file']):
+        if _mentions(triggers, _UPLOAD_WORDS):
             research['topics_to_research'].append("File upload best practices")
             research['libraries_to_fetch'].append(
                 {"name": "aws-sdk", "topic": "s3 upload"}
             )
             
-        if any(word in name + desc for word in ['next', 'nextjs', 'next.js']):
+        if _mentions(triggers, _NEXTJS_WORDS):
             research['libraries_to_fetch'].append(
                 {"name": "next.js", "topic": None}  # General docs
             )
             
-        if any(word in name + desc for word in ['react', 'component', 'hook']):
+        if _mentions(triggers, _REACT_WORDS):
             research['libraries_to_fetch'].append(
                 {"name": "react", "topic": "hooks"}
             )
             
-        if any(word in name + desc for word in ['prisma', 'database', 'orm']):
+        if _mentions(triggers, _ORM_WORDS):
             research['libraries_to_fetch'].append(
                 {"name": "prisma", "topic": "crud operations"}
             )
             
-        if any(word in name + desc for word in ['tailwind', 'css', 'styling']):
+        if _mentions(triggers, _STYLING_WORDS):
             research['libraries_to_fetch'].append(
                 {"name": "tailwindcss", "topic": None}
             )
             
-        if any(word in name + desc for word in ['zod', 'validation', 'schema']):
+        if _mentions(triggers, _VALIDATION_WORDS):
             research['libraries_to_fetch'].append(
                 {"name": "zod", "topic": "schema validation"}
             )
@@ -827,15 +1688,19 @@ class PrePlanningPhase:
 # Global instances
 _spawner: Optional[SubagentSpawner] = None
 _pre_planner: Optional[PrePlanningPhase] = None
+_registry: Optional[SubagentRegistry] = None
 
 
 def init_subagent_system(project_dir: str) -> Dict[str, Any]:
     """Initialize the subagent system."""
-    global _spawner, _pre_planner
+    global _spawner, _pre_planner, _registry
     
     path = Path(project_dir)
     _spawner = SubagentSpawner(path)
     _pre_planner = PrePlanningPhase(path)
+    if _registry is not None:
+        _registry.shutdown()
+    _registry = SubagentRegistry()
     
     return {
         "success": True,
@@ -848,7 +1713,8 @@ def init_subagent_system(project_dir: str) -> Dict[str, Any]:
 def spawn_feature_subagent(
     feature: Dict[str, Any],
     relevant_code: List[Dict[str, Any]] = None,
-    agent_type: str = None
+    agent_type: str = None,
+    background: bool = False
 ) -> Dict[str, Any]:
     """
     Spawn a fresh subagent to implement a feature.
@@ -860,13 +1726,89 @@ def spawn_feature_subagent(
         feature: Feature dict
         relevant_code: Code snippets from Aleph search
         agent_type: Type of agent (e2e_test_agent, docker_agent, etc.)
+        background: Return a session_id immediately instead of waiting;
+            poll with subagent_status
     """
     if _spawner is None:
         return {"error": "Subagent system not initialized"}
 
+    if background:
+        return _registry.submit(_spawner, feature, relevant_code, agent_type).to_dict()
+
     return _spawner.spawn_for_feature(feature, relevant_code, agent_type=agent_type)
 
 
+def subagent_status(session_id: str) -> Dict[str, Any]:
+    """Status, output tail and (once finished) result of a background subagent."""
+    if _registry is None:
+        return {"error": "Subagent system not initialized"}
+    
+    task = _registry.get(session_id)
+    if task is None:
+        return {"error": f"Unknown subagent session: {session_id}"}
+    return task.to_dict(include_result=True)
+
+
+def list_subagents() -> Dict[str, Any]:
+    """List background subagents from the last hour."""
+    if _registry is None:
+        return {"error": "Subagent system not initialized"}
+    
+    return {"subagents": [task.to_dict() for task in _registry.list()]}
+
+
+def cancel_subagent(session_id: str) -> Dict[str, Any]:
+    """Cancel a queued or running background subagent."""
+    if _registry is None:
+        return {"error": "Subagent system not initialized"}
+    
+    return {
+        "session_id": session_id,
+        "cancelled": _registry.cancel(session_id)
+    }
+
+
+async def spawn_feature_subagents_batch(
+    spawns: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """
+    Spawn subagents for several features concurrently.
+    
+    Wall time is roughly that of the slowest subagent rather than the
+    sum, with at most SubagentConfig.max_parallel running at once.
+
+    Args:
+        spawns: Dicts with feature, and optionally relevant_code and agent_type
+
+    Returns:
+        One result per entry, in input order
+    """
+    if _spawner is None:
+        return [{"error": "Subagent system not initialized"}]
+
+    return await _spawner.spawn_batch(spawns)
+
+
+async def spawn_forked_subagents_batch(
+    shared_context: str,
+    forks: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """
+    Spawn subagents that share a common context prefix.
+
+    Args:
+        shared_context: Context common to every fork
+        forks: Dicts with id and payload (fork-specific context)
+
+    Returns:
+        One result per fork, in input order
+    """
+    if _spawner is None:
+        return [{"error": "Subagent system not initialized"}]
+
+    return await _spawner.spawn_agents_batch(shared_context, forks)
+
+
 def discuss_feature(
     feature: Dict[str, Any],
     questions: List[str] = None
@@ -916,8 +1858,9 @@ def research_feature(
     return _pre_planner.research_feature(feature, topics)
 
 
+@functools.lru_cache(maxsize=1)
 def get_subagent_tools() -> List[Dict[str, Any]]:
-    """Get tool definitions for MCP registration."""
+    """Get tool definitions for MCP registration (built once; don't mutate)."""
     agent_types_desc = ", ".join(AGENT_TYPE_PROMPTS.keys())
     return [
         {
@@ -938,11 +1881,116 @@ def get_subagent_tools() -> List[Dict[str, Any]]:
                         "type": "string",
                         "description": "Type of agent to spawn",
                         "enum": list(AGENT_TYPE_PROMPTS.keys())
+                    },
+                    "background": {
+                        "type": "boolean",
+                        "description": "Return a session_id immediately and run in the background (poll with subagent_status)",
+                        "default": False
                     }
                 },
                 "required": ["feature"]
             }
         },
+        {
+            "name": "subagent_status",
+            "description": "Status, recent output and result of a background subagent.",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "session_id": {
+                        "type": "string",
+                        "description": "session_id returned by subagent_spawn"
+                    }
+                },
+                "required": ["session_id"]
+            }
+        },
+        {
+            "name": "subagent_list",
+            "description": "List background subagents and their status.",
+            "inputSchema": {
+                "type": "object",
+                "properties": {}
+            }
+        },
+        {
+            "name": "subagent_cancel",
+            "description": "Cancel a queued or running background subagent.",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "session_id": {
+                        "type": "string",
+                        "description": "session_id returned by subagent_spawn"
+                    }
+                },
+                "required": ["session_id"]
+            }
+        },
+        {
+            "name": "subagent_spawn_batch",
+            "description": "Spawn several subagents in parallel, one per feature. Results are returned in input order.",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "spawns": {
+                        "type": "array",
+                        "description": "One entry per subagent",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "feature": {
+                                    "type": "object",
+                                    "description": "Feature dict with id, name, description, test_cases"
+                                },
+                                "relevant_code": {
+                                    "type": "array",
+                                    "description": "Code snippets from Aleph search"
+                                },
+                                "agent_type": {
+                                    "type": "string",
+                                    "description": "Type of agent to spawn",
+                                    "enum": list(AGENT_TYPE_PROMPTS.keys())
+                                }
+                            },
+                            "required": ["feature"]
+                        }
+                    }
+                },
+                "required": ["spawns"]
+            }
+        },
+        {
+            "name": "subagent_spawn_batch_forked",
+            "description": "Spawn several subagents in parallel that share one large context prefix (sent once, prompt-cached) and differ only by a small payload each.",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "shared_context": {
+                        "type": "string",
+                        "description": "Context common to all forks (agent role, repo context, decisions)"
+                    },
+                    "forks": {
+                        "type": "array",
+                        "description": "One entry per subagent",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "id": {
+                                    "description": "Caller-chosen fork id, echoed back as fork_id"
+                                },
+                                "payload": {
+                                    "type": "string",
+                                    "description": "Fork-specific context (the feature to implement)"
+                                }
+                            },
+                            "required": ["payload"]
+                        }
+                    }
+                },
+                "required": ["shared_context", "forks"]
+            }
+        },
         {
             "name": "feature_discuss",
             "description": "Pre-planning discussion. Surface unclear requirements, edge cases, dependencies BEFORE implementing.",
@@ -998,28 +2046,46 @@ def get_subagent_tools() -> List[Dict[str, Any]]:
     ]
 
 
+def _run_sync(coro):
+    """Run a coroutine to completion from synchronous code."""
+    import asyncio
+    
+    return asyncio.run(coro)
+
+
+_SUBAGENT_TOOL_HANDLERS = {
+    "subagent_spawn": lambda args: spawn_feature_subagent(
+        args["feature"],
+        args.get("relevant_code"),
+        args.get("agent_type"),
+        args.get("background", False)
+    ),
+    "subagent_status": lambda args: subagent_status(args["session_id"]),
+    "subagent_list": lambda args: list_subagents(),
+    "subagent_cancel": lambda args: cancel_subagent(args["session_id"]),
+    "subagent_spawn_batch": lambda args: _run_sync(
+        spawn_feature_subagents_batch(args["spawns"])
+    ),
+    "subagent_spawn_batch_forked": lambda args: _run_sync(
+        spawn_forked_subagents_batch(args["shared_context"], args["forks"])
+    ),
+    "feature_discuss": lambda args: discuss_feature(
+        args["feature"],
+        args.get("questions")
+    ),
+    "feature_assumptions": lambda args: list_feature_assumptions(
+        args["feature"]
+    ),
+    "feature_research": lambda args: research_feature(
+        args["feature"],
+        args.get("topics")
+    )
+}
+
+
 def handle_subagent_tool(name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
     """Handle a subagent/pre-planning tool call."""
-    handlers = {
-        "subagent_spawn": lambda args: spawn_feature_subagent(
-            args["feature"],
-            args.get("relevant_code"),
-            args.get("agent_type")
-        ),
-        "feature_discuss": lambda args: discuss_feature(
-            args["feature"],
-            args.get("questions")
-        ),
-        "feature_assumptions": lambda args: list_feature_assumptions(
-            args["feature"]
-        ),
-        "feature_research": lambda args: research_feature(
-            args["feature"],
-            args.get("topics")
-        )
-    }
-    
-    handler = handlers.get(name)
+    handler = _SUBAGENT_TOOL_HANDLERS.get(name)
     if handler is None:
         return {"error": f"Unknown tool: {name}"}
     
@@ -1029,13 +2095,33 @@ def handle_subagent_tool(name: str, arguments: Dict[str, Any]) -> Dict[str, Any]
         return {"error": str(e)}
 
 
+async def handle_subagent_tool_async(name: str, arguments: Dict[str, Any]) -> Any:
+    """
+    Handle a subagent/pre-planning tool call from an event loop.
+    
+    Batches are awaited directly; everything else runs in a worker
+    thread so a long subagent doesn't stall the MCP server.
+    """
+    import asyncio
+    
+    try:
+        if name == "subagent_spawn_batch":
+            return await spawn_feature_subagents_batch(arguments["spawns"])
+        if name == "subagent_spawn_batch_forked":
+            return await spawn_forked_subagents_batch(
+                arguments["shared_context"], arguments["forks"]
+            )
+    except Exception as e:
+        return {"error": str(e)}
+    
+    return await asyncio.to_thread(handle_subagent_tool, name, arguments)
+
+
 # =============================================================================
 # CLI TESTING
 # =============================================================================
 
 if __name__ == "__main__":
-    import sys
-    
     # Test pre-planning
     test_feature = {
         "id": 1,
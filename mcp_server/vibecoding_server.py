@@ -19,7 +19,12 @@ Set VIBES_USE_BEADS=true to enable git-backed mode.
 
 import os
 import json
+import time
+import sqlite3
 import asyncio
+import hashlib
+import functools
+import threading
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -33,11 +38,42 @@ except ImportError:
     MCP_AVAILABLE = False
     print("[feature_mcp] Warning: MCP SDK not installed")
 
+# Tool responses are compact unless VIBES_PRETTY=1 (for debugging)
+PRETTY_RESPONSES = os.getenv("VIBES_PRETTY", "0") == "1"
+
+# orjson (optional) for the JSON on every tool call: test_cases columns,
+# verification notes and MCP responses
+try:
+    import orjson
+
+    def _dumps(obj: Any, pretty: bool = False) -> str:
+        """JSON text, compact by default (str() fallback for unknown types)."""
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=str, option=option).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any, pretty: bool = False) -> str:
+        """JSON text, compact by default (str() fallback for unknown types)."""
+        if pretty:
+            return json.dumps(obj, default=str, indent=2)
+        return json.dumps(obj, default=str, separators=(",", ":"))
+
+    _loads = json.loads
+
 # SQLAlchemy imports for feature management
-from sqlalchemy import create_engine, Column, Integer, String, Text, Boolean
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy import (
+    create_engine, event, bindparam, case, select, update,
+    Column, Index, Integer, String, Text, Boolean
+)
+from sqlalchemy.types import TypeDecorator
+from sqlalchemy.orm import (
+    scoped_session, sessionmaker, declarative_base, deferred, undefer
+)
+from sqlalchemy.pool import QueuePool
 from sqlalchemy.sql import func
-import random
 
 # Gastown integration for git-backed persistence
 try:
@@ -69,7 +105,7 @@ from aleph_bridge import (
 
 from subagent_spawner import (
     get_subagent_tools,
-    handle_subagent_tool,
+    handle_subagent_tool_async,
     init_subagent_system
 )
 
@@ -97,20 +133,96 @@ from typing import Union
 Base = declarative_base()
 
 
+class JSONList(TypeDecorator):
+    """JSON array stored as text, decoded once when the row is loaded."""
+    impl = Text
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return None if value is None else _dumps(value)
+
+    def process_result_value(self, value, dialect):
+        return _loads(value) if value else []
+
+
 class Feature(Base):
     """Feature model for SQLAlchemy."""
     __tablename__ = "features"
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     name = Column(String(255), nullable=False)
-    description = Column(Text)
-    test_cases = Column(Text)  # JSON array of test cases
+    # Wide text columns are deferred so by-id status updates read only the
+    # narrow columns; reads that return them undefer them in the same SELECT
+    description = deferred(Column(Text))
+    test_cases = deferred(Column(JSONList))  # JSON array of test cases
     status = Column(String(50), default="pending")  # pending, in_progress, passing, skipped, needs_review
     priority = Column(Integer, default=0)
     verification_status = Column(String(50), default="pending")  # pending, verified, failed
-    verification_notes = Column(Text)
-    created_at = Column(String(50))
-    updated_at = Column(String(50))
+    verification_notes = deferred(Column(Text))  # JSON quality/verification report
+    # Timestamps are filled in by SQLite (CURRENT_TIMESTAMP) inside the
+    # INSERT/UPDATE statements themselves
+    created_at = Column(String(50), default=func.now())
+    updated_at = Column(String(50), default=func.now(), onupdate=func.now())
+
+
+# Stats group by status; the queue is read by status ordered by priority
+Index("ix_features_status", Feature.status)
+Index("ix_features_status_priority", Feature.status, Feature.priority.desc())
+
+
+# Hot queries, built once so SQLAlchemy's compiled cache is hit on every call
+
+# Feature counts per status
+_STMT_STATUS_COUNTS = (
+    select(Feature.status, func.count(Feature.id))
+    .group_by(Feature.status)
+)
+
+# Next feature: in_progress first, then needs_review, then the
+# highest-priority pending feature
+_STMT_NEXT_FEATURE = (
+    select(Feature)
+    .where(Feature.status.in_(["in_progress", "needs_review", "pending"]))
+    .order_by(
+        case({"in_progress": 0, "needs_review": 1}, value=Feature.status, else_=2),
+        Feature.priority.desc(),
+        Feature.id
+    )
+    .options(
+        undefer(Feature.description),
+        undefer(Feature.test_cases),
+        undefer(Feature.verification_notes)
+    )
+    .limit(1)
+)
+
+# Atomic claim of the highest-priority pending feature: one UPDATE, so two
+# agents can't both pick up the same feature (RETURNING needs SQLite 3.35+)
+_SQLITE_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35)
+
+_STMT_CLAIM_NEXT = (
+    update(Feature)
+    .where(
+        Feature.id == (
+            select(Feature.id)
+            .where(Feature.status == "pending")
+            .order_by(Feature.priority.desc(), Feature.id)
+            .limit(1)
+            .scalar_subquery()
+        )
+    )
+    .values(status="in_progress")
+    .returning(Feature.id, Feature.name, Feature.description, Feature.test_cases)
+)
+
+# Random sample of passing features (SQLite picks; only :count rows load)
+_STMT_REGRESSION_SAMPLE = (
+    select(Feature)
+    .where(Feature.status == "passing")
+    .order_by(func.random())
+    .options(undefer(Feature.test_cases))
+    .limit(bindparam("count"))
+)
 
 
 # Global state
@@ -120,11 +232,89 @@ _quality_runner: Optional[QualityGateRunner] = None
 _bead_adapter: Optional["BeadFeatureAdapter"] = None  # Gastown adapter
 _use_beads: bool = False  # Runtime flag for backend selection
 _thinking_enabled: bool = True  # Enable cognitive enhancement features
+_quality_cache: Dict[str, Dict[str, Any]] = {}  # working-tree hash -> quick check result
+_write_gen: int = 0  # bumped by every SQLite write in this module
+_stats_cache: Dict[str, Any] = {}  # {"key": _stats_key(), "val": stats}
+_version_conn: Optional[sqlite3.Connection] = None  # read-only probe for PRAGMA data_version
+_stats_lock = threading.Lock()
+
+# Bump when the features schema changes (stored in SQLite's user_version)
+SCHEMA_VERSION = 1
+
+# Cached quality results older than this are discarded
+QUALITY_CACHE_TTL_SECONDS = 90 * 24 * 3600
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """
+    Per-connection SQLite tuning: WAL so readers don't block the writer,
+    synchronous=NORMAL (durable in WAL mode, far fewer fsyncs), and larger
+    in-memory caches.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB
+    cursor.execute("PRAGMA cache_size=-64000")  # 64 MB
+    cursor.close()
+
+
+def _bump_write_gen() -> None:
+    """Invalidate cached reads after a write to the features table."""
+    global _write_gen
+    with _stats_lock:
+        _write_gen += 1
+
+
+def _data_version() -> int:
+    """
+    PRAGMA data_version of the probe connection. The probe never writes,
+    so the value changes on every commit to features.db, including those
+    made by subagents' own server processes. Caller holds _stats_lock.
+    """
+    return _version_conn.execute("PRAGMA data_version").fetchone()[0]
+
+
+def _stats_key() -> tuple:
+    """
+    Cache key for feature stats: local write generation plus
+    data_version. Caller holds _stats_lock.
+    """
+    return (_write_gen, _data_version())
+
+
+def _commit_status_change(old: str, new: str) -> None:
+    """
+    Commit after one feature moved from old to new status, carrying an
+    up-to-date stats cache over by adjusting its counts instead of
+    dropping it.
+    """
+    global _write_gen
+    # Flushing takes SQLite's write lock, so no other connection can commit
+    # between the data_version check below and this commit
+    _db_session.flush()
+    with _stats_lock:
+        current = _stats_cache.get("key") == _stats_key()
+        cached = _stats_cache.get("val") if current else None
+        _db_session.commit()
+        _write_gen += 1
+        if cached is None:
+            return
+        if old != new:
+            if old not in cached or new not in cached or cached[old] <= 0:
+                return  # untracked status; recount on the next read
+            cached[old] -= 1
+            cached[new] += 1
+            total = cached["total"]
+            cached["progress_percent"] = round((cached["passing"] / total * 100) if total > 0 else 0, 1)
+        _stats_cache["key"] = _stats_key()
 
 
 def init_database(project_dir: str) -> None:
     """Initialize database connection (SQLite or Beads)."""
     global _db_session, _project_dir, _quality_runner, _bead_adapter, _use_beads
+    global _version_conn
 
     _project_dir = Path(project_dir)
     _use_beads = USE_BEADS and GASTOWN_AVAILABLE
@@ -138,10 +328,44 @@ def init_database(project_dir: str) -> None:
         # Use traditional SQLite
         print(f"[feature_mcp] Using SQLite backend")
         db_path = _project_dir / "features.db"
-        engine = create_engine(f"sqlite:///{db_path}")
-        Base.metadata.create_all(engine)
-        Session = sessionmaker(bind=engine)
-        _db_session = Session()
+        # Pooled connections shared across threads, so tool calls running in
+        # worker threads each check out their own instead of queueing on one
+        engine = create_engine(
+            f"sqlite:///{db_path}",
+            query_cache_size=1200,
+            poolclass=QueuePool,
+            pool_size=10,
+            max_overflow=5,
+            connect_args={"check_same_thread": False}
+        )
+        event.listen(engine, "connect", _set_sqlite_pragmas)
+        # Schema setup only runs when the file's user_version is behind, so
+        # warm restarts skip the catalog lookups
+        with engine.begin() as conn:
+            if conn.exec_driver_sql("PRAGMA user_version").scalar() < SCHEMA_VERSION:
+                Base.metadata.create_all(conn)
+                # create_all skips existing tables, so add indexes to older databases
+                for index in Feature.__table__.indexes:
+                    index.create(conn, checkfirst=True)
+                conn.exec_driver_sql(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        # Thread-local sessions: tool handlers running in worker threads
+        # each get their own session instead of sharing one. Reads and
+        # writes are explicit, so no autoflush before queries, and committed
+        # features keep their loaded attributes instead of re-SELECTing
+        _db_session = scoped_session(sessionmaker(
+            bind=engine, autoflush=False, expire_on_commit=False
+        ))
+        # Separate connection that only reads PRAGMA data_version, so
+        # commits from other processes invalidate the stats cache
+        if _version_conn is not None:
+            _version_conn.close()
+        _version_conn = sqlite3.connect(
+            f"{db_path.resolve().as_uri()}?mode=ro", uri=True,
+            check_same_thread=False
+        )
+        with _stats_lock:
+            _stats_cache.clear()
+        _bump_write_gen()
 
     # Initialize quality runner (used by both backends)
     _quality_runner = QualityGateRunner(_project_dir)
@@ -313,10 +537,99 @@ def enhanced_feature_analysis(feature: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+# =============================================================================
+# QUALITY RESULT CACHE
+# =============================================================================
+
+def _working_tree_hash() -> Optional[str]:
+    """
+    Hash of git HEAD plus the content of every modified or untracked file.
+
+    The server's own database files are left out: they are rewritten on
+    every feature update and would otherwise defeat the cache.
+
+    Returns None when the project is not a git repository, in which case
+    results are not cached.
+    """
+    if _project_dir is None:
+        return None
+
+    try:
+        head = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=_project_dir, capture_output=True, timeout=30
+        )
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "-z", "--untracked-files=all",
+             "--", ".", ":(exclude)features.db*"],
+            cwd=_project_dir, capture_output=True, timeout=30
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if head.returncode != 0 or status.returncode != 0:
+        return None
+
+    # Entries are "XY path"; renames/copies are followed by the source path
+    paths = []
+    entries = iter(status.stdout.split(b"\0"))
+    for entry in entries:
+        if len(entry) < 4:
+            continue
+        paths.append(entry[3:])
+        if entry[:1] in (b"R", b"C"):
+            next(entries, None)
+
+    digest = hashlib.sha1(head.stdout)
+    for path in sorted(paths):
+        digest.update(path + b"\0")
+        try:
+            digest.update(hashlib.sha1((_project_dir / os.fsdecode(path)).read_bytes()).digest())
+        except OSError:
+            digest.update(b"-")  # deleted, or a directory
+    return digest.hexdigest()
+
+
+def _run_quick_checks_cached(force_recheck: bool = False) -> Dict[str, Any]:
+    """
+    Run the quick quality checks, reusing the last result for an
+    unchanged working tree.
+    """
+    tree_hash = None if force_recheck else _working_tree_hash()
+
+    now = time.time()
+    for key in [k for k, v in _quality_cache.items()
+                if now - v["cached_at"] > QUALITY_CACHE_TTL_SECONDS]:
+        del _quality_cache[key]
+
+    if tree_hash is not None and tree_hash in _quality_cache:
+        return _quality_cache[tree_hash]["result"]
+
+    result = _quality_runner.run_quick_checks()
+    if force_recheck:
+        tree_hash = _working_tree_hash()
+    if tree_hash is not None:
+        _quality_cache[tree_hash] = {"cached_at": now, "result": result}
+    return result
+
+
 # =============================================================================
 # FEATURE MANAGEMENT TOOLS (with Quality Gate Integration)
 # =============================================================================
 
+def _requires_backend(fn):
+    """
+    Return the not-initialized error unless a backend is ready. Decorated
+    functions route to Beads first, so their SQLite path can assume a session.
+    """
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if _db_session is None and not (_use_beads and _bead_adapter):
+            return {"error": "Database not initialized"}
+        return fn(*args, **kwargs)
+    return wrapper
+
+
+@_requires_backend
 def feature_get_stats() -> Dict[str, Any]:
     """Get feature statistics."""
     # Route to Beads backend if enabled
@@ -326,28 +639,34 @@ def feature_get_stats() -> Dict[str, Any]:
         return result
 
     # SQLite backend
-    if _db_session is None:
-        return {"error": "Database not initialized"}
-
-    total = _db_session.query(Feature).count()
-    passing = _db_session.query(Feature).filter(Feature.status == "passing").count()
-    pending = _db_session.query(Feature).filter(Feature.status == "pending").count()
-    in_progress = _db_session.query(Feature).filter(Feature.status == "in_progress").count()
-    skipped = _db_session.query(Feature).filter(Feature.status == "skipped").count()
-    needs_review = _db_session.query(Feature).filter(Feature.status == "needs_review").count()
-
-    return {
+    # Counts only change when this process writes (write generation) or
+    # another connection commits to features.db (data_version)
+    with _stats_lock:
+        key = _stats_key()
+        if _stats_cache.get("key") == key:
+            return dict(_stats_cache["val"])
+
+    # One scan for all statuses instead of a COUNT per status
+    counts = dict(_db_session.execute(_STMT_STATUS_COUNTS).all())
+    total = sum(counts.values())
+    passing = counts.get("passing", 0)
+
+    stats = {
         "total": total,
         "passing": passing,
-        "pending": pending,
-        "in_progress": in_progress,
-        "skipped": skipped,
-        "needs_review": needs_review,
+        "pending": counts.get("pending", 0),
+        "in_progress": counts.get("in_progress", 0),
+        "skipped": counts.get("skipped", 0),
+        "needs_review": counts.get("needs_review", 0),
         "progress_percent": round((passing / total * 100) if total > 0 else 0, 1),
         "backend": "sqlite"
     }
+    with _stats_lock:
+        _stats_cache.update(key=key, val=stats)
+    return dict(stats)
 
 
+@_requires_backend
 def feature_get_next() -> Dict[str, Any]:
     """Get the next feature to implement with enhanced thinking analysis."""
     # Route to Beads backend if enabled
@@ -361,81 +680,81 @@ def feature_get_next() -> Dict[str, Any]:
         return result
 
     # SQLite backend
-    if _db_session is None:
-        return {"error": "Database not initialized"}
+    next_feature = _db_session.execute(_STMT_NEXT_FEATURE).scalar_one_or_none()
 
-    # First check for in_progress features
-    in_progress = _db_session.query(Feature).filter(
-        Feature.status == "in_progress"
-    ).first()
+    if next_feature is None:
+        return {"message": "All features complete!", "remaining": 0}
 
-    if in_progress:
+    if next_feature.status == "in_progress":
         return {
-            "id": in_progress.id,
-            "name": in_progress.name,
-            "description": in_progress.description,
-            "test_cases": json.loads(in_progress.test_cases) if in_progress.test_cases else [],
+            "id": next_feature.id,
+            "name": next_feature.name,
+            "description": next_feature.description,
+            "test_cases": next_feature.test_cases,
             "status": "in_progress",
             "note": "Resuming in-progress feature",
             "backend": "sqlite"
         }
 
-    # Check for features needing review
-    needs_review = _db_session.query(Feature).filter(
-        Feature.status == "needs_review"
-    ).first()
-
-    if needs_review:
+    if next_feature.status == "needs_review":
         return {
-            "id": needs_review.id,
-            "name": needs_review.name,
-            "description": needs_review.description,
-            "test_cases": json.loads(needs_review.test_cases) if needs_review.test_cases else [],
+            "id": next_feature.id,
+            "name": next_feature.name,
+            "description": next_feature.description,
+            "test_cases": next_feature.test_cases,
             "status": "needs_review",
-            "verification_notes": needs_review.verification_notes,
+            "verification_notes": next_feature.verification_notes,
             "note": "Feature needs review before marking complete",
             "backend": "sqlite"
         }
 
-    # Get next pending feature by priority
-    next_feature = _db_session.query(Feature).filter(
-        Feature.status == "pending"
-    ).order_by(Feature.priority.desc(), Feature.id).first()
-
-    if next_feature:
-        # Mark as in_progress
+    # Next pending feature: mark as in_progress
+    if _SQLITE_HAS_RETURNING:
+        claimed = _db_session.execute(_STMT_CLAIM_NEXT).one_or_none()
+    else:
         next_feature.status = "in_progress"
+        claimed = next_feature
+    if claimed is None:
         _db_session.commit()
+        _bump_write_gen()
+    else:
+        _commit_status_change("pending", "in_progress")
+
+    if claimed is None:
+        # Another agent claimed the last pending feature first
+        return {"message": "All features complete!", "remaining": 0}
+
+    feature_data = {
+        "id": claimed.id,
+        "name": claimed.name,
+        "description": claimed.description,
+        "test_cases": claimed.test_cases,
+        "status": "in_progress",
+        "backend": "sqlite"
+    }
 
-        feature_data = {
-            "id": next_feature.id,
-            "name": next_feature.name,
-            "description": next_feature.description,
-            "test_cases": json.loads(next_feature.test_cases) if next_feature.test_cases else [],
-            "status": "in_progress",
-            "backend": "sqlite"
-        }
-
-        # Apply enhanced thinking analysis
-        return enhanced_feature_analysis(feature_data)
-
-    return {"message": "All features complete!", "remaining": 0}
+    # Apply enhanced thinking analysis
+    return enhanced_feature_analysis(feature_data)
 
 
+@_requires_backend
 def feature_mark_passing(
     feature_id: Any,  # Can be int (SQLite) or str (Beads)
-    skip_verification: bool = False
+    skip_verification: bool = False,
+    force_recheck: bool = False
 ) -> Dict[str, Any]:
     """
     Mark a feature as passing.
 
-    By default, runs quality checks before marking complete.
-    Set skip_verification=True to bypass (not recommended).
+    By default, runs quality checks before marking complete. Results are
+    reused while the working tree is unchanged; set force_recheck=True
+    to run them regardless. Set skip_verification=True to bypass (not
+    recommended).
     """
     # Run quality checks first (shared by both backends)
     quality_result = None
     if not skip_verification and _quality_runner:
-        quality_result = _quality_runner.run_quick_checks()
+        quality_result = _run_quick_checks_cached(force_recheck)
 
     # Route to Beads backend if enabled
     if _use_beads and _bead_adapter:
@@ -452,21 +771,20 @@ def feature_mark_passing(
         return result
 
     # SQLite backend
-    if _db_session is None:
-        return {"error": "Database not initialized"}
-
-    feature = _db_session.query(Feature).filter(Feature.id == feature_id).first()
+    feature = _db_session.get(Feature, feature_id)
 
     if not feature:
         return {"error": f"Feature {feature_id} not found"}
 
+    old_status = feature.status
+
     # Check quality result
     if quality_result and quality_result.get("status") == "failed":
         # Don't mark as passing, set to needs_review
         feature.status = "needs_review"
         feature.verification_status = "failed"
-        feature.verification_notes = json.dumps(quality_result)
-        _db_session.commit()
+        feature.verification_notes = _dumps(quality_result)
+        _commit_status_change(old_status, "needs_review")
 
         return {
             "success": False,
@@ -481,12 +799,13 @@ def feature_mark_passing(
     # Mark as passing
     feature.status = "passing"
     feature.verification_status = "verified"
-    _db_session.commit()
+    _commit_status_change(old_status, "passing")
 
     # Trigger Aleph refresh
     if _project_dir:
         on_feature_complete(str(_project_dir), feature_id)
 
+    # Usually served from the stats cache carried over above
     stats = feature_get_stats()
 
     return {
@@ -510,7 +829,10 @@ def feature_verify(feature_id: int) -> Dict[str, Any]:
     if _db_session is None:
         return {"error": "Database not initialized"}
     
-    feature = _db_session.query(Feature).filter(Feature.id == feature_id).first()
+    feature = _db_session.get(
+        Feature, feature_id,
+        options=[undefer(Feature.description), undefer(Feature.test_cases)]
+    )
     
     if not feature:
         return {"error": f"Feature {feature_id} not found"}
@@ -519,12 +841,14 @@ def feature_verify(feature_id: int) -> Dict[str, Any]:
         "id": feature.id,
         "name": feature.name,
         "description": feature.description,
-        "test_cases": json.loads(feature.test_cases) if feature.test_cases else []
+        "test_cases": feature.test_cases
     }
     
     # Run verification
     result = verify_feature_implementation(feature_dict)
     
+    old_status = feature.status
+
     # Update feature status based on result
     if result.get("overall_status") == "passed":
         feature.verification_status = "verified"
@@ -532,8 +856,8 @@ def feature_verify(feature_id: int) -> Dict[str, Any]:
         feature.status = "needs_review"
         feature.verification_status = "needs_review"
     
-    feature.verification_notes = json.dumps(result)
-    _db_session.commit()
+    feature.verification_notes = _dumps(result)
+    _commit_status_change(old_status, feature.status)
     
     return {
         "feature_id": feature_id,
@@ -542,6 +866,7 @@ def feature_verify(feature_id: int) -> Dict[str, Any]:
     }
 
 
+@_requires_backend
 def feature_skip(feature_id: Any, reason: str = "") -> Dict[str, Any]:
     """Skip a feature (move to end of queue)."""
     # Route to Beads backend if enabled
@@ -552,18 +877,17 @@ def feature_skip(feature_id: Any, reason: str = "") -> Dict[str, Any]:
         return result
 
     # SQLite backend
-    if _db_session is None:
-        return {"error": "Database not initialized"}
-
-    feature = _db_session.query(Feature).filter(Feature.id == feature_id).first()
+    feature = _db_session.get(Feature, feature_id)
 
     if not feature:
         return {"error": f"Feature {feature_id} not found"}
 
+    old_status = feature.status
+
     # Lower priority and reset status
     feature.status = "pending"
     feature.priority = feature.priority - 100  # Move down in queue
-    _db_session.commit()
+    _commit_status_change(old_status, "pending")
 
     return {
         "success": True,
@@ -575,6 +899,7 @@ def feature_skip(feature_id: Any, reason: str = "") -> Dict[str, Any]:
     }
 
 
+@_requires_backend
 def feature_get_for_regression(count: int = 3) -> Dict[str, Any]:
     """Get random passing features for regression testing."""
     # Route to Beads backend if enabled
@@ -584,24 +909,19 @@ def feature_get_for_regression(count: int = 3) -> Dict[str, Any]:
         return result
 
     # SQLite backend
-    if _db_session is None:
-        return {"error": "Database not initialized"}
-
-    passing_features = _db_session.query(Feature).filter(
-        Feature.status == "passing"
-    ).all()
+    selected = _db_session.execute(
+        _STMT_REGRESSION_SAMPLE, {"count": max(count, 0)}
+    ).scalars().all()
 
-    if not passing_features:
+    if not selected:
         return {"features": [], "message": "No passing features yet"}
 
-    selected = random.sample(passing_features, min(count, len(passing_features)))
-
     return {
         "features": [
             {
                 "id": f.id,
                 "name": f.name,
-                "test_cases": json.loads(f.test_cases) if f.test_cases else []
+                "test_cases": f.test_cases
             }
             for f in selected
         ],
@@ -609,6 +929,7 @@ def feature_get_for_regression(count: int = 3) -> Dict[str, Any]:
     }
 
 
+@_requires_backend
 def feature_create_bulk(features: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Create multiple features at once (used by initializer)."""
     # Route to Beads backend if enabled
@@ -619,27 +940,27 @@ def feature_create_bulk(features: List[Dict[str, Any]]) -> Dict[str, Any]:
         return result
 
     # SQLite backend
-    if _db_session is None:
-        return {"error": "Database not initialized"}
-
-    created = []
-    for i, f in enumerate(features):
-        feature = Feature(
-            name=f.get("name", f"Feature {i+1}"),
-            description=f.get("description", ""),
-            test_cases=json.dumps(f.get("test_cases", [])),
-            status="pending",
-            priority=f.get("priority", len(features) - i)
-        )
-        _db_session.add(feature)
-        created.append(feature.name)
-
+    # Plain row mappings skip the unit of work (identity map, events,
+    # autoflush) and go out as one executemany INSERT
+    count = len(features)
+    rows = [
+        {
+            "name": f.get("name", f"Feature {i+1}"),
+            "description": f.get("description", ""),
+            "test_cases": f.get("test_cases", []),
+            "status": "pending",
+            "priority": f.get("priority", count - i)
+        }
+        for i, f in enumerate(features)
+    ]
+    _db_session.bulk_insert_mappings(Feature, rows)
     _db_session.commit()
+    _bump_write_gen()
 
     return {
         "success": True,
-        "created_count": len(created),
-        "features": created,
+        "created_count": count,
+        "features": [row["name"] for row in rows],
         "backend": "sqlite"
     }
 
@@ -648,8 +969,9 @@ def feature_create_bulk(features: List[Dict[str, Any]]) -> Dict[str, Any]:
 # TOOL DEFINITIONS
 # =============================================================================
 
+@functools.lru_cache(maxsize=1)
 def get_feature_tools() -> List[Dict[str, Any]]:
-    """Get feature management tool definitions."""
+    """Get feature management tool definitions (built once; don't mutate)."""
     return [
         {
             "name": "feature_get_stats",
@@ -681,6 +1003,11 @@ def get_feature_tools() -> List[Dict[str, Any]]:
                         "type": "boolean",
                         "description": "Skip quality checks (not recommended)",
                         "default": False
+                    },
+                    "force_recheck": {
+                        "type": "boolean",
+                        "description": "Re-run quality checks even if the working tree is unchanged since the last run",
+                        "default": False
                     }
                 },
                 "required": ["feature_id"]
@@ -758,27 +1085,29 @@ def get_feature_tools() -> List[Dict[str, Any]]:
     ]
 
 
+_FEATURE_TOOL_HANDLERS = {
+    "feature_get_stats": lambda args: feature_get_stats(),
+    "feature_get_next": lambda args: feature_get_next(),
+    "feature_mark_passing": lambda args: feature_mark_passing(
+        args["feature_id"],
+        args.get("skip_verification", False),
+        args.get("force_recheck", False)
+    ),
+    "feature_verify": lambda args: feature_verify(args["feature_id"]),
+    "feature_skip": lambda args: feature_skip(
+        args["feature_id"], 
+        args.get("reason", "")
+    ),
+    "feature_get_for_regression": lambda args: feature_get_for_regression(
+        args.get("count", 3)
+    ),
+    "feature_create_bulk": lambda args: feature_create_bulk(args["features"])
+}
+
+
 def handle_feature_tool(name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
     """Handle a feature management tool call."""
-    handlers = {
-        "feature_get_stats": lambda args: feature_get_stats(),
-        "feature_get_next": lambda args: feature_get_next(),
-        "feature_mark_passing": lambda args: feature_mark_passing(
-            args["feature_id"],
-            args.get("skip_verification", False)
-        ),
-        "feature_verify": lambda args: feature_verify(args["feature_id"]),
-        "feature_skip": lambda args: feature_skip(
-            args["feature_id"], 
-            args.get("reason", "")
-        ),
-        "feature_get_for_regression": lambda args: feature_get_for_regression(
-            args.get("count", 3)
-        ),
-        "feature_create_bulk": lambda args: feature_create_bulk(args["features"])
-    }
-    
-    handler = handlers.get(name)
+    handler = _FEATURE_TOOL_HANDLERS.get(name)
     if handler is None:
         return {"error": f"Unknown feature tool: {name}"}
     
@@ -807,47 +1136,48 @@ async def run_mcp_server(project_dir: str):
     # Create server
     server = Server("autocoder-vibecoding-quality")
     
-    # Combine all tools
-    all_tools = (
-        get_feature_tools() +
-        get_aleph_tools() +
-        get_subagent_tools() +
-        get_quality_tools()
-    )
+    # Combine all tools, each group with the handler that serves it
+    tool_groups = [
+        (get_feature_tools(), handle_feature_tool),
+        (get_aleph_tools(), handle_aleph_tool),
+        (get_subagent_tools(), handle_subagent_tool_async),
+        (get_quality_tools(), handle_quality_tool)
+    ]
 
     # Add kanban tools if using Beads backend
     if _use_beads and GASTOWN_AVAILABLE:
-        all_tools = all_tools + get_kanban_tools()
+        tool_groups.append((get_kanban_tools(), handle_kanban_tool))
         print("[feature_mcp] Kanban tools enabled (Beads mode)")
+
+    all_tools = [t for tools, _ in tool_groups for t in tools]
+    dispatch = {t["name"]: handler for tools, handler in tool_groups for t in tools}
+    
+    # The tool set is fixed for the server's lifetime
+    tool_list = [
+        Tool(
+            name=t["name"],
+            description=t["description"],
+            inputSchema=t["inputSchema"]
+        )
+        for t in all_tools
+    ]
     
     @server.list_tools()
     async def list_tools() -> List[Tool]:
-        return [
-            Tool(
-                name=t["name"],
-                description=t["description"],
-                inputSchema=t["inputSchema"]
-            )
-            for t in all_tools
-        ]
+        return tool_list
     
     @server.call_tool()
     async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
         # Route to appropriate handler
-        if name.startswith("aleph_"):
-            result = handle_aleph_tool(name, arguments)
-        elif name.startswith("quality_"):
-            result = handle_quality_tool(name, arguments)
-        elif name.startswith("kanban_") and _use_beads and GASTOWN_AVAILABLE:
-            result = handle_kanban_tool(name, arguments)
-        elif name.startswith("feature_") and name not in ["feature_discuss", "feature_assumptions", "feature_research"]:
-            result = handle_feature_tool(name, arguments)
-        elif name.startswith("subagent_") or name in ["feature_discuss", "feature_assumptions", "feature_research"]:
-            result = handle_subagent_tool(name, arguments)
-        else:
+        handler = dispatch.get(name)
+        if handler is None:
             result = {"error": f"Unknown tool: {name}"}
+        else:
+            result = handler(name, arguments)
+            if asyncio.iscoroutine(result):
+                result = await result
 
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return [TextContent(type="text", text=_dumps(result, PRETTY_RESPONSES))]
     
     # Run server with initialization options
     init_options = InitializationOptions(
@@ -7,15 +7,22 @@ Returns a structured list of issues for Claude to fix
 import os
 import sys
 import json
+import asyncio
 import subprocess
 from pathlib import Path
 
 try:
-    from openai import OpenAI
+    from openai import AsyncOpenAI
 except ImportError:
     print("Installing openai package...")
     subprocess.check_call([sys.executable, "-m", "pip", "install", "openai", "-q"])
-    from openai import OpenAI
+    from openai import AsyncOpenAI
+
+# Only the start of each file is sent for review
+MAX_FILE_BYTES = 8000
+
+# Files reviewed at once (one request each), to stay under rate limits
+MAX_CONCURRENT_REQUESTS = 8
 
 
 def get_recent_changes():
@@ -33,29 +40,23 @@ def get_recent_changes():
 
 
 def read_files(file_paths):
-    """Read content of specified files"""
+    """Read the first MAX_FILE_BYTES of each specified file"""
     contents = {}
     for path in file_paths:
         try:
-            full_path = Path(path)
-            if full_path.exists() and full_path.stat().st_size < 50000:  # Skip large files
-                contents[path] = full_path.read_text()
+            with open(path, "rb") as fh:
+                data = fh.read(MAX_FILE_BYTES)
+            if b"\0" in data:  # Skip binary files
+                continue
+            # The cut may split a multi-byte character
+            contents[path] = data.decode("utf-8", errors="replace")
         except:
             pass
     return contents
 
 
-def analyze_with_openai(files_content, api_key):
-    """Send code to OpenAI for analysis"""
-    client = OpenAI(api_key=api_key)
-
-    # Build the prompt
-    code_sections = []
-    for path, content in files_content.items():
-        code_sections.append(f"### {path}\n```\n{content[:8000]}\n```")
-
-    code_text = "\n\n".join(code_sections)
-
+async def _analyze_file(client, semaphore, path, content):
+    """Review one file; returns the raw model response"""
     prompt = f"""Analyze the following code for bugs, security issues, and potential problems.
 
 Return a JSON array of issues found. Each issue should have:
@@ -68,22 +69,61 @@ Return a JSON array of issues found. Each issue should have:
 
 Only return the JSON array, no other text.
 
-{code_text}
+### {path}
+```
+{content}
+```
 """
 
-    response = client.chat.completions.create(
-        model="gpt-4o",
-        messages=[
-            {"role": "system", "content": "You are a code review expert. Analyze code for bugs and issues. Return only valid JSON."},
-            {"role": "user", "content": prompt}
-        ],
-        temperature=0.1,
-        max_tokens=4000
-    )
+    async with semaphore:
+        response = await client.chat.completions.create(
+            model="gpt-4o",
+            messages=[
+                {"role": "system", "content": "You are a code review expert. Analyze code for bugs and issues. Return only valid JSON."},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0.1,
+            max_tokens=4000
+        )
 
     return response.choices[0].message.content
 
 
+async def _analyze_all(files_content, api_key):
+    client = AsyncOpenAI(api_key=api_key)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    try:
+        return await asyncio.gather(*[
+            _analyze_file(client, semaphore, path, content)
+            for path, content in files_content.items()
+        ], return_exceptions=True)
+    finally:
+        await client.close()
+
+
+def analyze_with_openai(files_content, api_key):
+    """
+    Send code to OpenAI for analysis, one concurrent request per file so
+    each file gets its own output budget.
+
+    Returns {path: raw response}; a file whose request failed maps to
+    the exception instead, so one failure does not lose the other reviews.
+    """
+    results = asyncio.run(_analyze_all(files_content, api_key))
+    return dict(zip(files_content, results))
+
+
+def parse_issues(result):
+    """Parse a response's JSON array (raises json.JSONDecodeError)"""
+    # Clean up response (remove markdown code blocks if present)
+    clean_result = result.strip()
+    if clean_result.startswith("```"):
+        clean_result = clean_result.split("\n", 1)[1]
+    if clean_result.endswith("```"):
+        clean_result = clean_result.rsplit("```", 1)[0]
+    return json.loads(clean_result)
+
+
 def main():
     # Get API key from environment or argument
     api_key = os.environ.get("OPENAI_API_KEY")
@@ -120,51 +160,56 @@ def main():
 
     # Analyze with OpenAI
     try:
-        result = analyze_with_openai(contents, api_key)
+        results = analyze_with_openai(contents, api_key)
+    except Exception as e:
+        print(f"Error calling OpenAI: {e}")
+        sys.exit(1)
 
+    issues = []
+    failed = 0
+    for path, result in results.items():
+        if isinstance(result, Exception):
+            print(f"Error calling OpenAI for {path}: {result}")
+            failed += 1
+            continue
+        if result is None:
+            print(f"Empty response from OpenAI for {path}")
+            failed += 1
+            continue
         # Try to parse as JSON
         try:
-            # Clean up response (remove markdown code blocks if present)
-            clean_result = result.strip()
-            if clean_result.startswith("```"):
-                clean_result = clean_result.split("\n", 1)[1]
-            if clean_result.endswith("```"):
-                clean_result = clean_result.rsplit("```", 1)[0]
-
-            issues = json.loads(clean_result)
-
-            if not issues:
-                print("\n✅ No issues found!")
-                return
-
-            print(f"\n🔍 Found {len(issues)} issues:\n")
-
-            for i, issue in enumerate(issues, 1):
-                severity_icon = {
-                    "critical": "🔴",
-                    "high": "🟠",
-                    "medium": "🟡",
-                    "low": "🟢"
-                }.get(issue.get("severity", "medium"), "⚪")
-
-                print(f"{i}. {severity_icon} [{issue.get('severity', 'unknown').upper()}] {issue.get('file', 'unknown')}:{issue.get('line', 'N/A')}")
-                print(f"   Type: {issue.get('type', 'unknown')}")
-                print(f"   Issue: {issue.get('description', 'No description')}")
-                print(f"   Fix: {issue.get('fix', 'No suggestion')}")
-                print()
-
-            # Output as JSON for programmatic use
-            print("\n--- JSON OUTPUT ---")
-            print(json.dumps(issues, indent=2))
-
+            issues.extend(parse_issues(result))
         except json.JSONDecodeError:
-            print("Raw response from OpenAI:")
+            print(f"Raw response from OpenAI for {path}:")
             print(result)
 
-    except Exception as e:
-        print(f"Error calling OpenAI: {e}")
+    if failed == len(results):
         sys.exit(1)
 
+    if not issues:
+        print("\n✅ No issues found!")
+        return
+
+    print(f"\n🔍 Found {len(issues)} issues:\n")
+
+    for i, issue in enumerate(issues, 1):
+        severity_icon = {
+            "critical": "🔴",
+            "high": "🟠",
+            "medium": "🟡",
+            "low": "🟢"
+        }.get(issue.get("severity", "medium"), "⚪")
+
+        print(f"{i}. {severity_icon} [{issue.get('severity', 'unknown').upper()}] {issue.get('file', 'unknown')}:{issue.get('line', 'N/A')}")
+        print(f"   Type: {issue.get('type', 'unknown')}")
+        print(f"   Issue: {issue.get('description', 'No description')}")
+        print(f"   Fix: {issue.get('fix', 'No suggestion')}")
+        print()
+
+    # Output as JSON for programmatic use
+    print("\n--- JSON OUTPUT ---")
+    print(json.dumps(issues, indent=2))
+
 
 if __name__ == "__main__":
     main()
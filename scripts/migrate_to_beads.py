@@ -13,55 +13,189 @@ Usage:
 What it does:
 1. Reads all features from features.db (SQLite)
 2. Creates Bead YAML files in .git/beads/
-3. Commits each Bead to git for audit trail
+3. Commits the Beads to git in batches for audit trail
 4. Creates a backup of the original database
+5. Writes a per-Bead report to .git/beads-migration-report.jsonl
+
+Re-running skips features whose Bead exists and whose SQLite row is
+unchanged since it was migrated (row hashes are kept in
+.git/beads-migration-index.json); pass --force to rewrite everything.
 
 After migration:
 - Set VIBES_USE_BEADS=true to use the new backend
 - The original features.db is preserved as features.db.backup
 """
 
+import os
+import re
 import sys
 import json
 import shutil
+import sqlite3
+import hashlib
+import functools
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "mcp_server"))
 
-from sqlalchemy import create_engine, Column, Integer, String, Text
-from sqlalchemy.orm import sessionmaker, declarative_base
-
 from gastown_integration import BeadStore, Bead, migrate_feature_to_bead
 
 
-Base = declarative_base()
+# Rows fetched from SQLite per round trip while streaming features
+FETCH_BATCH_SIZE = 500
+
+# Beads per git commit during migration (one add + commit per batch)
+COMMIT_BATCH_SIZE = 200
+
+# Migrated features between progress lines (failures are always printed)
+PROGRESS_INTERVAL = 100
+
+# Threads writing Beads (YAML dumping in libyaml and file writes release
+# the GIL)
+MIGRATION_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 
+# Features without an integer id get a generated Bead id, which scans the
+# existing Beads; serialize those so two threads can't pick the same id
+_generated_id_lock = threading.Lock()
 
-class Feature(Base):
-    """Feature model matching the SQLite schema."""
-    __tablename__ = "features"
+# Top-level "status:" key of a Bead file. Continuation lines of multi-line
+# values are always indented, so a match at column 0 is the key itself
+_BEAD_STATUS_RE = re.compile(rb"^status:[ \t]*['\"]?([^'\"\s]+)", re.M)
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    name = Column(String(255), nullable=False)
-    description = Column(Text)
-    test_cases = Column(Text)
-    status = Column(String(50), default="pending")
-    priority = Column(Integer, default=0)
-    verification_status = Column(String(50), default="pending")
-    verification_notes = Column(Text)
-    created_at = Column(String(50))
-    updated_at = Column(String(50))
+# Columns of the features table (mcp_server/vibecoding_server.py), in the
+# order the migration SELECTs them
+FEATURE_COLUMNS = (
+    "id", "name", "description", "test_cases", "status", "priority",
+    "verification_status", "verification_notes", "created_at", "updated_at",
+)
 
+_SQL_COUNT_FEATURES = "SELECT COUNT(*) FROM features"
+_SQL_SELECT_FEATURES = f"SELECT {', '.join(FEATURE_COLUMNS)} FROM features"
+_SQL_COUNT_BY_STATUS = "SELECT status, COUNT(*) FROM features GROUP BY status"
 
-def migrate_sqlite_to_beads(project_dir: Path, dry_run: bool = False) -> dict:
+
+def _connect_readonly(db_path: Path) -> sqlite3.Connection:
+    """
+    Open features.db read-only, tuned for sequential reads: a larger page
+    cache, memory-mapped reads and in-memory temp storage. Journal settings
+    are left alone since journal_mode is persistent and the server runs the
+    file in WAL mode.
+    """
+    connection = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    cursor = connection.cursor()
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-65536")  # 64 MB
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB
+    cursor.close()
+    return connection
+
+
+def _commit_beads(project_dir: Path, paths: list) -> None:
+    """Stage and commit a batch of Bead files in one git add/commit."""
+    def git(*args, stdin=None):
+        subprocess.run(
+            ["git"] + list(args),
+            cwd=str(project_dir),
+            input=stdin,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+
+    # Paths go over stdin, so a large batch can't exceed the argv limit
+    git("add", "--pathspec-from-file=-", "--pathspec-file-nul", stdin="\0".join(paths))
+    git("commit", "-m", f"Migrate {len(paths)} features from SQLite", "--allow-empty")
+
+
+def _backup_database(db_path: Path, backup_path: Path) -> None:
+    """
+    Copy features.db to backup_path. When the server has left committed
+    pages in the WAL, SQLite's backup API copies a consistent database;
+    otherwise cp --reflink=auto shares blocks on copy-on-write filesystems
+    and falls back to a normal copy elsewhere. (A hardlink would not be a
+    backup: SQLite rewrites the file in place.)
+    """
+    wal_path = db_path.with_name(db_path.name + "-wal")
+    if wal_path.exists() and wal_path.stat().st_size > 0:
+        src = sqlite3.connect(str(db_path))
+        dst = sqlite3.connect(str(backup_path))
+        try:
+            src.backup(dst)
+        finally:
+            dst.close()
+            src.close()
+        return
+
+    try:
+        subprocess.run(
+            ["cp", "--reflink=auto", str(db_path), str(backup_path)],
+            capture_output=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        shutil.copy(db_path, backup_path)
+
+
+def _migrate_row(row, bead_store: BeadStore) -> tuple:
+    """Write one feature row as a Bead; returns (feature_dict, bead, error)."""
+    feature_dict = dict(zip(FEATURE_COLUMNS, row))
+    try:
+        if isinstance(feature_dict["id"], int):
+            bead = migrate_feature_to_bead(feature_dict, bead_store)
+        else:
+            with _generated_id_lock:
+                bead = migrate_feature_to_bead(feature_dict, bead_store)
+        return feature_dict, bead, None
+    except Exception as e:
+        return feature_dict, None, e
+
+
+def _existing_bead_ids(beads_dir: Path) -> set:
+    """Ids of the Beads already written to beads_dir (one scandir pass)."""
+    with os.scandir(beads_dir) as entries:
+        return {e.name[:-5] for e in entries if e.name.endswith(".yaml")}
+
+
+def _row_hash(row: tuple) -> str:
+    """Content hash of a feature row (all FEATURE_COLUMNS, in order)."""
+    return hashlib.blake2b(repr(row).encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _load_index(index_path: Path) -> dict:
+    """Bead id -> hash of the SQLite row it was last migrated from."""
+    try:
+        return json.loads(index_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_index(index_path: Path, index: dict) -> None:
+    index_path.write_text(json.dumps(index), encoding="utf-8")
+
+
+def migrate_sqlite_to_beads(
+    project_dir: Path,
+    dry_run: bool = False,
+    commit_batch_size: int = COMMIT_BATCH_SIZE,
+    force: bool = False,
+    workers: int = MIGRATION_WORKERS
+) -> dict:
     """
     Migrate features from SQLite to Beads.
 
     Args:
         project_dir: Project directory containing features.db
         dry_run: If True, show what would be migrated without actually doing it
+        commit_batch_size: Beads written per git commit
+        force: Rewrite features whose Bead already exists. By default they
+            are skipped (so a re-run resumes an interrupted migration)
+            unless their SQLite row changed since it was migrated
+        workers: Threads writing Beads
 
     Returns:
         Migration result dict
@@ -75,88 +209,137 @@ def migrate_sqlite_to_beads(project_dir: Path, dry_run: bool = False) -> dict:
             "migrated": 0
         }
 
-    # Connect to SQLite
-    engine = create_engine(f"sqlite:///{db_path}")
-    Session = sessionmaker(bind=engine)
-    session = Session()
+    # Connect to SQLite (read-only). The migration only dumps rows, so it
+    # reads them through sqlite3 directly as plain tuples; SQLAlchemy's
+    # statement compilation and result processing would be pure overhead
+    conn = _connect_readonly(db_path)
 
-    # Load all features
-    features = session.query(Feature).all()
+    # Count up front, then stream rows in batches rather than loading
+    # every feature (and its text columns) before the first Bead is written
+    total = conn.execute(_SQL_COUNT_FEATURES).fetchone()[0]
 
-    if not features:
+    if not total:
+        conn.close()
         return {
             "success": True,
             "message": "No features to migrate",
             "migrated": 0
         }
 
-    print(f"Found {len(features)} features to migrate")
+    print(f"Found {total} features to migrate")
+    cursor = conn.execute(_SQL_SELECT_FEATURES)
+    batches = iter(lambda: cursor.fetchmany(FETCH_BATCH_SIZE), [])
 
     if dry_run:
         print("\n=== DRY RUN - No changes will be made ===\n")
-        for f in features:
-            print(f"  [{f.status}] {f.id}: {f.name}")
+        for rows in batches:
+            for row in rows:
+                f = dict(zip(FEATURE_COLUMNS, row))
+                print(f"  [{f['status']}] {f['id']}: {f['name']}")
+        conn.close()
         return {
             "success": True,
             "dry_run": True,
-            "would_migrate": len(features)
+            "would_migrate": total
         }
 
-    # Initialize Bead store
-    bead_store = BeadStore(project_dir, auto_commit=True)
+    # Initialize Bead store; commits are batched below instead of one
+    # git add/commit per Bead
+    bead_store = BeadStore(project_dir, auto_commit=False)
 
-    # Migrate each feature
-    migrated = []
+    # Migrate each feature. Per-Bead results are streamed to a JSONL report
+    # next to the beads directory instead of being collected for the result
+    report_path = bead_store.beads_dir.parent / "beads-migration-report.jsonl"
+    report = open(report_path, "w", encoding="utf-8", buffering=1 << 16)
+    migrated = 0
+    skipped = 0
     errors = []
-
-    for feature in features:
-        try:
-            # Convert to dict
-            feature_dict = {
-                "id": feature.id,
-                "name": feature.name,
-                "description": feature.description,
-                "test_cases": feature.test_cases,
-                "status": feature.status,
-                "priority": feature.priority,
-                "verification_status": feature.verification_status,
-                "verification_notes": feature.verification_notes,
-                "created_at": feature.created_at,
-                "updated_at": feature.updated_at,
-            }
-
-            # Migrate to Bead
-            bead = migrate_feature_to_bead(feature_dict, bead_store)
-            migrated.append({
-                "old_id": feature.id,
-                "new_id": bead.id,
-                "name": bead.name,
-                "status": bead.status
-            })
-            print(f"  ✓ Migrated: {feature.id} -> {bead.id} ({feature.name})")
-
-        except Exception as e:
-            errors.append({
-                "id": feature.id,
-                "name": feature.name,
-                "error": str(e)
-            })
-            print(f"  ✗ Failed: {feature.id} ({feature.name}): {e}")
-
-    session.close()
+    pending_paths = []
+    existing = set() if force else _existing_bead_ids(bead_store.beads_dir)
+    # Row hashes from earlier runs tell a changed row from an unchanged one
+    index_path = bead_store.beads_dir.parent / "beads-migration-index.json"
+    index = _load_index(index_path)
+
+    # Each fetched batch is written by the thread pool; results come back
+    # in row order, so output and commit batches stay deterministic
+    migrate_row = functools.partial(_migrate_row, bead_store=bead_store)
+    with report, ThreadPoolExecutor(max_workers=workers) as pool:
+        for rows in batches:
+            if existing:
+                # Same id scheme as migrate_feature_to_bead for integer ids
+                todo = []
+                for row in rows:
+                    feature_id = row[0]  # FEATURE_COLUMNS starts with id
+                    bead_id = f"gt-feat-{feature_id:03d}" if isinstance(feature_id, int) else None
+                    if bead_id in existing:
+                        # Rewrite only if the row changed since it was
+                        # migrated. Beads with no recorded hash weren't
+                        # written by this script (or predate the index), so
+                        # they are left alone too
+                        recorded = index.get(bead_id)
+                        if recorded is None or recorded == _row_hash(row):
+                            report.write(json.dumps({
+                                "old_id": feature_id,
+                                "new_id": bead_id,
+                                "skipped": True
+                            }) + "\n")
+                            skipped += 1
+                            continue
+                    todo.append(row)
+                rows = todo
+
+            for feature, bead, error in pool.map(migrate_row, rows):
+                if error is not None:
+                    errors.append({
+                        "id": feature["id"],
+                        "name": feature["name"],
+                        "error": str(error)
+                    })
+                    print(f"  ✗ Failed: {feature['id']} ({feature['name']}): {error}")
+                    continue
+
+                report.write(json.dumps({
+                    "old_id": feature["id"],
+                    "new_id": bead.id,
+                    "name": bead.name,
+                    "status": bead.status
+                }, ensure_ascii=False) + "\n")
+                index[bead.id] = _row_hash(tuple(feature.values()))
+                migrated += 1
+                if migrated % PROGRESS_INTERVAL == 0:
+                    print(f"  ✓ Migrated {migrated}/{total}")
+
+                bead_path = bead_store.beads_dir / f"{bead.id}.yaml"
+                pending_paths.append(str(bead_path.relative_to(project_dir)))
+                if len(pending_paths) >= commit_batch_size:
+                    _commit_beads(project_dir, pending_paths)
+                    _save_index(index_path, index)
+                    pending_paths = []
+
+    conn.close()
+
+    if migrated % PROGRESS_INTERVAL:
+        print(f"  ✓ Migrated {migrated}/{total}")
+    if skipped:
+        print(f"  - Skipped {skipped} unchanged, already migrated (use --force to rewrite)")
+
+    if pending_paths:
+        _commit_beads(project_dir, pending_paths)
+    _save_index(index_path, index)
 
     # Backup original database
     backup_path = project_dir / "features.db.backup"
     if not backup_path.exists():
-        shutil.copy(db_path, backup_path)
+        _backup_database(db_path, backup_path)
         print(f"\nOriginal database backed up to: {backup_path}")
 
     return {
         "success": len(errors) == 0,
-        "migrated": len(migrated),
+        "migrated": migrated,
+        "skipped": skipped,
         "errors": len(errors),
-        "beads": migrated,
         "error_details": errors if errors else None,
+        "report": str(report_path),
         "beads_dir": str(bead_store.beads_dir)
     }
 
@@ -176,24 +359,30 @@ def verify_migration(project_dir: Path) -> dict:
     if not db_path.exists():
         return {"error": "SQLite database not found"}
 
-    # Count SQLite features
-    engine = create_engine(f"sqlite:///{db_path}")
-    Session = sessionmaker(bind=engine)
-    session = Session()
-    sqlite_count = session.query(Feature).count()
-    sqlite_by_status = {}
-    for status in ["pending", "in_progress", "passing", "skipped", "needs_review"]:
-        sqlite_by_status[status] = session.query(Feature).filter(Feature.status == status).count()
-    session.close()
+    # Count SQLite features: one GROUP BY scan for the total and every status
+    conn = _connect_readonly(db_path)
+    sqlite_by_status = dict.fromkeys(
+        ["pending", "in_progress", "passing", "skipped", "needs_review"], 0
+    )
+    sqlite_by_status.update(conn.execute(_SQL_COUNT_BY_STATUS).fetchall())
+    sqlite_count = sum(sqlite_by_status.values())
+    conn.close()
 
     # Count Beads
+    # Only the status is needed, so scan each file for it rather than
+    # parsing every Bead
     bead_store = BeadStore(project_dir, auto_commit=False)
-    beads = bead_store.load_all()
-    bead_count = len(beads)
+    bead_count = 0
     beads_by_status = {}
-    for bead in beads:
-        status = bead.status
-        beads_by_status[status] = beads_by_status.get(status, 0) + 1
+    with os.scandir(bead_store.beads_dir) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".yaml"):
+                continue
+            with open(entry.path, "rb") as f:
+                match = _BEAD_STATUS_RE.search(f.read())
+            status = match.group(1).decode() if match else "pending"
+            bead_count += 1
+            beads_by_status[status] = beads_by_status.get(status, 0) + 1
 
     return {
         "sqlite": {
@@ -225,6 +414,23 @@ def main():
         action="store_true",
         help="Show what would be migrated without making changes"
     )
+    parser.add_argument(
+        "--commit-batch-size",
+        type=int,
+        default=COMMIT_BATCH_SIZE,
+        help=f"Beads per git commit during migration (default: {COMMIT_BATCH_SIZE})"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=MIGRATION_WORKERS,
+        help=f"Threads writing Beads (default: {MIGRATION_WORKERS})"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rewrite features that already have a Bead instead of skipping them"
+    )
     parser.add_argument(
         "--verify",
         action="store_true",
@@ -249,7 +455,13 @@ def main():
             print("\n✗ Migration mismatch: counts differ")
     else:
         print("=== Migrating Features to Beads ===\n")
-        result = migrate_sqlite_to_beads(project_dir, dry_run=args.dry_run)
+        result = migrate_sqlite_to_beads(
+            project_dir,
+            dry_run=args.dry_run,
+            commit_batch_size=max(args.commit_batch_size, 1),
+            force=args.force,
+            workers=max(args.workers, 1)
+        )
 
         print("\n=== Result ===")
         print(json.dumps(result, indent=2))
@@ -111,6 +111,9 @@ pip3 install --user --break-system-packages --quiet aleph-rlm[mcp] || {
 # MCP SDK
 pip3 install --user --break-system-packages --quiet mcp || echo_warning "MCP SDK not installed"
 
+# Optional: faster JSON serialization
+pip3 install --user --break-system-packages --quiet orjson || echo_warning "orjson not installed (optional)"
+
 echo_success "Dependencies installed"
 
 # =============================================================================